@@ -0,0 +1,192 @@
+"""
+benchmark.py  —  Headless microbenchmarks for Podcast Timer
+Times the tick, render, resize and settings paths of podcast_timer.py at
+several zoom factors and reports per-call latency percentiles and Tk calls
+per operation. On Linux without $DISPLAY it starts a virtual X server.
+Requires: everything in requirements.txt, plus Xvfb on headless Linux (apt install xvfb)
+Run:      python benchmark.py [--fs 0.7 1.0 1.4 2.0] [-n 200] [--out results.json] [--compare old.json]
+"""
+import argparse, atexit, json, os, platform, shutil, subprocess, sys, tempfile, time
+
+OPS = ("_tick", "_draw_bar", "_apply_stage", "pulse_tick", "_do_resize", "_apply_settings")
+
+# ── Virtual display ───────────────────────────────────────────────────────
+def _ensure_display():
+    """Start Xvfb on a free display number if there is no X server to talk to."""
+    if os.environ.get("DISPLAY") or not sys.platform.startswith("linux"): return
+    if not shutil.which("Xvfb"):
+        sys.exit("No $DISPLAY and Xvfb is not installed (apt install xvfb).")
+    for n in range(99, 199):
+        if os.path.exists(f"/tmp/.X11-unix/X{n}") or os.path.exists(f"/tmp/.X{n}-lock"): continue
+        proc = subprocess.Popen(["Xvfb", f":{n}", "-screen", "0", "1920x1200x24", "-nolisten", "tcp"],
+                                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        for _ in range(100):                       # wait up to 5 s for the socket
+            if os.path.exists(f"/tmp/.X11-unix/X{n}"): break
+            if proc.poll() is not None: break
+            time.sleep(0.05)
+        if proc.poll() is None:
+            atexit.register(proc.terminate)
+            os.environ["DISPLAY"] = f":{n}"
+            return
+    sys.exit("Could not start Xvfb.")
+
+# ── Tk call counting ──────────────────────────────────────────────────────
+class _CountingTk:
+    """Stands in for a widget's tkapp and counts every Tcl command it forwards."""
+    def __init__(self, tkapp):
+        self._tkapp = tkapp; self.calls = 0
+
+    def call(self, *args):
+        self.calls += 1
+        return self._tkapp.call(*args)
+
+    def __getattr__(self, name): return getattr(self._tkapp, name)
+
+def _install_counter(root, counter):
+    # Existing widgets get the proxy here; widgets created later copy it from their master
+    stack = [root]
+    while stack:
+        w = stack.pop()
+        w.tk = counter
+        stack.extend(w.children.values())
+
+# ── Measurement ───────────────────────────────────────────────────────────
+def _percentile(sorted_vals, q):
+    if not sorted_vals: return 0.0
+    i = min(len(sorted_vals) - 1, max(0, int(round(q * (len(sorted_vals) - 1)))))
+    return sorted_vals[i]
+
+def _measure(app, counter, fn, n):
+    """Run fn() n times; each sample includes the idle redraw/layout work it caused."""
+    fn(); app.update_idletasks()                   # warm-up
+    times = []; calls = []
+    for i in range(n):
+        c0 = counter.calls; t0 = time.perf_counter()
+        fn(); app.update_idletasks()
+        times.append((time.perf_counter() - t0) * 1000); calls.append(counter.calls - c0)
+    times.sort()
+    return {"n": n, "mean_ms": sum(times) / n,
+            "p50_ms": _percentile(times, 0.50), "p90_ms": _percentile(times, 0.90),
+            "p99_ms": _percentile(times, 0.99), "max_ms": times[-1],
+            "tk_calls": sum(calls) / n}
+
+def _bench_fs(pt, app, counter, fs, n):
+    app._get_fs = lambda: fs
+    app._do_resize(); app.update()
+    top, bot = app.top_zone, app.bot_zone
+    results = {}
+
+    # _tick: one simulated second per call on a fake engine clock
+    now = [0.0]
+    app._on_reset()
+    app.engine = pt.TimerEngine(lambda: now[0])
+    top.set_time(99, 0); bot.set_time(2, 0)
+    app._on_start()
+    def tick():
+        now[0] += 1.0
+        if bot.remain_sec == 0: app._on_next()
+        app._tick()
+    results["_tick"] = _measure(app, counter, tick, n)
+
+    # _draw_bar: fill edge moving one step per call
+    step = [0]
+    def draw_bar():
+        step[0] += 1; top._bar_pct = (step[0] % 100) / 100; top._draw_bar()
+    results["_draw_bar"] = _measure(app, counter, draw_bar, n)
+
+    # _apply_stage: cycle through every stage so each call has real work
+    stages = ("great", "yellow", "red", "done")
+    def apply_stage():
+        step[0] += 1; top.stage = stages[step[0] % 4]; top._apply_stage()
+    results["_apply_stage"] = _measure(app, counter, apply_stage, n)
+
+    # pulse_tick: "done" animates the digits and zone background
+    top.stage = "done"; top._apply_stage()
+    def pulse():
+        step[0] += 1; top.pulse_tick(step[0] % (pt.PULSE_STEPS + 1))
+    results["pulse_tick"] = _measure(app, counter, pulse, n)
+    app._on_reset()
+
+    # _do_resize: alternate between fs and a 5% larger zoom
+    flip = [False]
+    def resize():
+        flip[0] = not flip[0]
+        app._get_fs = (lambda: round(fs * 1.05, 3)) if flip[0] else (lambda: fs)
+        app._do_resize()
+    results["_do_resize"] = _measure(app, counter, resize, max(10, n // 4))
+    app._get_fs = lambda: fs; app._do_resize()
+
+    # _apply_settings: APPLY with the theme toggled each time
+    themes = ("dark", "light")
+    def apply_settings():
+        step[0] += 1
+        app._apply_settings(dict(app.settings, theme=themes[step[0] % 2]))
+    results["_apply_settings"] = _measure(app, counter, apply_settings, max(10, n // 4))
+    app._apply_settings(dict(app.settings, theme="dark"))
+    return results
+
+# ── Reporting ─────────────────────────────────────────────────────────────
+def _print_table(report):
+    print(f"\nPodcast Timer {report['version']} — {report['platform']}, Tk {report['tk']}")
+    print(f"{'fs':>5}  {'operation':<16}{'p50 ms':>9}{'p90 ms':>9}{'p99 ms':>9}{'max ms':>9}{'Tk calls':>10}")
+    for fs, ops in report["results"].items():
+        for op in OPS:
+            r = ops[op]
+            print(f"{fs:>5}  {op:<16}{r['p50_ms']:9.3f}{r['p90_ms']:9.3f}{r['p99_ms']:9.3f}"
+                  f"{r['max_ms']:9.3f}{r['tk_calls']:10.1f}")
+
+def _print_compare(report, baseline):
+    print(f"\nvs {baseline.get('version', '?')} ({baseline.get('timestamp', '?')}) — ratio new/old, <1 is faster")
+    print(f"{'fs':>5}  {'operation':<16}{'p50':>8}{'p90':>8}{'Tk calls':>10}")
+    ratio = lambda a, b: f"{a / b:8.2f}" if b else f"{'-':>8}"
+    for fs, ops in report["results"].items():
+        old_ops = baseline.get("results", {}).get(fs)
+        if not old_ops: continue
+        for op in OPS:
+            new, old = ops[op], old_ops.get(op)
+            if not old: continue
+            print(f"{fs:>5}  {op:<16}{ratio(new['p50_ms'], old['p50_ms'])}{ratio(new['p90_ms'], old['p90_ms'])}"
+                  f"  {ratio(new['tk_calls'], old['tk_calls'])}")
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Podcast Timer microbenchmarks")
+    ap.add_argument("--fs", type=float, nargs="+", default=[0.7, 1.0, 1.4, 2.0],
+                    help="zoom factors to benchmark (default: 0.7 1.0 1.4 2.0)")
+    ap.add_argument("-n", "--iterations", type=int, default=200, help="samples per operation")
+    ap.add_argument("--out", help="write JSON results here (default: bench_results/<version>-<time>.json)")
+    ap.add_argument("--compare", help="JSON results from an earlier run to compare against")
+    args = ap.parse_args(argv)
+
+    _ensure_display()
+    import podcast_timer as pt
+    # Keep the run away from the user's settings, journal and the network
+    tmp = tempfile.mkdtemp(prefix="podcast-timer-bench-")
+    pt.SETTINGS = pt._SettingsStore(os.path.join(tmp, "settings.json"))
+    pt.SETTINGS.save(dict(pt.DEFAULT_SETTINGS, audio_enabled=False))
+    pt.JOURNAL_FILE = os.path.join(tmp, "session.journal")
+
+    app = pt.PodcastTimerApp()
+    for job in ("recover", "update_check"): app.sched.cancel(job)
+    counter = _CountingTk(app.tk)
+    _install_counter(app, counter)
+    app.update()
+
+    results = {}
+    for fs in args.fs:
+        print(f"fs={fs} ...", file=sys.stderr, flush=True)
+        results[f"{fs:g}"] = _bench_fs(pt, app, counter, fs, args.iterations)
+    app.destroy()
+
+    report = {"version": pt.VERSION, "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+              "python": platform.python_version(), "platform": platform.platform(),
+              "tk": str(pt.tk.TkVersion), "iterations": args.iterations, "results": results}
+    _print_table(report)
+    out = args.out or os.path.join("bench_results", f"{pt.VERSION}-{time.strftime('%Y%m%d-%H%M%S')}.json")
+    os.makedirs(os.path.dirname(out) or ".", exist_ok=True)
+    with open(out, "w") as f: json.dump(report, f, indent=2)
+    print(f"\nSaved {out}")
+    if args.compare:
+        with open(args.compare) as f: _print_compare(report, json.load(f))
+
+if __name__ == "__main__":
+    main()
@@ -2,34 +2,98 @@
 podcast_timer.py  —  Podcast Timer v1.2.0
 Single-file app. Requires: customtkinter, pygame-ce, numpy, darkdetect
 Install: pip install customtkinter pygame-ce numpy darkdetect
-Run:     python podcast_timer.py
+Run:     python podcast_timer.py   [--startup-times] [--perf-overlay] [--control-port PORT]
+                                   [--osc-port PORT] [--sync-lead PORT | --sync-follow HOST:PORT]
+                                   [--headless] [--vad SOURCE] [--simulate]
 """
+import time
+_T0 = time.perf_counter()          # process start, for --startup-times
 import customtkinter as ctk
 import tkinter as tk
-import threading, time, math, os, sys, json, array as _arr
-import urllib.request, webbrowser
+from tkinter import messagebox
+import threading, queue, heapq, math, os, sys, json, argparse, atexit, tempfile, array as _arr
+import urllib.request, urllib.error, webbrowser, socket, struct
+from collections import OrderedDict, deque
 
 VERSION      = "1.2.0"
-GITHUB_API   = "https://api.github.com/repos/Hackpig1974/podcast-timer/releases/latest"
+# PODCAST_TIMER_API points the update check at another server (e.g. a local stub for testing)
+GITHUB_API   = os.environ.get("PODCAST_TIMER_API",
+                              "https://api.github.com/repos/Hackpig1974/podcast-timer/releases/latest")
 RELEASES_URL = "https://github.com/Hackpig1974/podcast-timer/releases/latest"
+# Files the app writes live next to the script, or next to the .exe when frozen (__file__ is in a temp dir then)
+DATA_DIR     = os.path.dirname(os.path.abspath(sys.executable if getattr(sys, "frozen", False) else __file__))
+UPDATE_CACHE_FILE = os.path.join(DATA_DIR, "update_cache.json")
+UPDATE_TTL_SEC    = 6 * 3600   # reuse the cached release tag this long without asking
+UPDATE_BACKOFF    = (900, 86400)   # failed checks: wait 15 min, doubling per failure up to a day
 
 def _check_for_update(callback):
     """Fetch latest release tag in background; call callback(new_version) if newer, else callback(None)."""
     def _run():
-        try:
-            req = urllib.request.Request(GITHUB_API,
-                headers={"User-Agent": "podcast-timer-app", "Accept": "application/vnd.github+json"})
-            with urllib.request.urlopen(req, timeout=5) as r:
-                data = json.loads(r.read().decode())
-            tag = data.get("tag_name", "").lstrip("v")
-            if tag and _newer(tag, VERSION):
-                callback(tag)
-            else:
-                callback(None)
-        except Exception:
-            callback(None)
+        try: tag = _latest_release_tag()
+        except Exception: tag = None
+        callback(tag if tag and _newer(tag, VERSION) else None)
     threading.Thread(target=_run, daemon=True).start()
 
+def _latest_release_tag(api=None, cache_file=None, now=None):
+    """Latest release tag, from the on-disk cache while it is fresh, else via a conditional request.
+
+    The cache keeps the tag, its ETag and when it was checked, so an unchanged
+    release costs a 304. Rate-limit replies (Retry-After, X-RateLimit-*) and
+    other failures set a retry time; until then the cached tag (if any) is used.
+    """
+    api = api or GITHUB_API; cache_file = cache_file or UPDATE_CACHE_FILE
+    now = time.time() if now is None else now
+    cache = _read_update_cache(cache_file)
+    if cache.get("url") != api: cache = {"url": api}
+    if now < cache.get("retry_after", 0): return cache.get("tag")
+    if cache.get("tag") and 0 <= now - cache.get("checked", 0) < UPDATE_TTL_SEC: return cache["tag"]
+    headers = {"User-Agent": "podcast-timer-app", "Accept": "application/vnd.github+json"}
+    if cache.get("etag") and cache.get("tag"): headers["If-None-Match"] = cache["etag"]
+    try:
+        with urllib.request.urlopen(urllib.request.Request(api, headers=headers), timeout=5) as r:
+            data = json.loads(r.read().decode()); rh = r.headers
+        cache.update(tag=data.get("tag_name", "").lstrip("v"), etag=rh.get("ETag"), checked=now, failures=0)
+        cache.pop("retry_after", None)
+        wait = _rate_limit_wait(rh, now)      # last request of the quota: don't ask again before reset
+        if wait: cache["retry_after"] = now + wait
+    except urllib.error.HTTPError as e:
+        wait = _rate_limit_wait(e.headers, now, e.code)
+        if e.code == 304:                     # unchanged: the cached tag is current
+            cache.update(checked=now, failures=0); cache.pop("retry_after", None)
+            if wait: cache["retry_after"] = now + wait
+        else:
+            cache["failures"] = cache.get("failures", 0) + 1
+            cache["retry_after"] = now + (wait or _update_backoff(cache["failures"]))
+    except Exception:
+        cache["failures"] = cache.get("failures", 0) + 1
+        cache["retry_after"] = now + _update_backoff(cache["failures"])
+    _write_update_cache(cache_file, cache)
+    return cache.get("tag")
+
+def _rate_limit_wait(headers, now, code=200):
+    """Seconds the server asked us to wait, from Retry-After or an exhausted X-RateLimit quota."""
+    if headers is None: return None
+    try:
+        if code in (403, 429) and headers.get("Retry-After"): return max(1, int(headers["Retry-After"]))
+        if headers.get("X-RateLimit-Remaining") == "0" and headers.get("X-RateLimit-Reset"):
+            return max(1, int(headers["X-RateLimit-Reset"]) - int(now))
+    except ValueError: pass
+    return None
+
+def _update_backoff(failures):
+    base, cap = UPDATE_BACKOFF
+    return min(cap, base * 2 ** max(0, failures - 1))
+
+def _read_update_cache(path):
+    try:
+        with open(path) as f: cache = json.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except Exception: return {}
+
+def _write_update_cache(path, cache):
+    try: write_json_atomic(path, cache)
+    except Exception: pass
+
 def _newer(remote, local):
     """Return True if remote version string is newer than local."""
     try:
@@ -39,42 +103,150 @@ def _newer(remote, local):
     except Exception:
         return False
 
+# ── Startup profile ───────────────────────────────────────────────────────
+class _StartupProfile:
+    """Per-phase startup durations in ms, printed by --startup-times."""
+    def __init__(self):
+        self.phases = OrderedDict(); self._lock = threading.Lock()
+
+    def mark(self, phase, since):
+        with self._lock: self.phases[phase] = (time.perf_counter() - since) * 1000
+
+    def report(self):
+        with self._lock: items = list(self.phases.items())
+        return "\n".join(f"  {name:<14}{ms:9.1f} ms" for name, ms in items)
+
+STARTUP = _StartupProfile()
+STARTUP.mark("imports", _T0)
+
 # ── Optional audio (pygame-ce preferred, plain pygame fallback) ───────────
+# pygame is imported and the mixer opened by init_audio() on a worker thread
+# after the window has painted, so neither delays startup.
 AUDIO_OK = False
-try:
-    import pygame
-    pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=512)
-    AUDIO_OK = True
-except Exception:
-    pass
+pygame = None
+
+def init_audio():
+    """Import pygame and open the mixer (once); returns AUDIO_OK. Runs on a worker thread."""
+    global pygame, AUDIO_OK
+    if AUDIO_OK: return True
+    t = time.perf_counter()
+    try:
+        import pygame as _pg
+        _pg.mixer.init(frequency=44100, size=-16, channels=2, buffer=512)
+        pygame = _pg; AUDIO_OK = True
+    except Exception:
+        pass
+    STARTUP.mark("mixer_init", t)
+    return AUDIO_OK
 
 # ── Settings ──────────────────────────────────────────────────────────────
-SETTINGS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "settings.json")
+SETTINGS_FILE = os.path.join(DATA_DIR, "settings.json")
 DEFAULT_SETTINGS = {
     "always_on_top": False, "theme": "dark",
     "audio_enabled": True,  "top_minutes": 20, "top_seconds": 0,
     "bot_minutes": 2,       "bot_seconds": 0,
+    "max_fps": 25,          "low_power": True,   # pulse animation frame-rate cap / slow down when hidden
+    "control_port": 0,      # localhost HTTP/SSE control server port; 0 = off
+    "osc_port": 0,          "osc_targets": [],   # OSC/UDP listen port (0 = off) / "host:port" stage-change receivers
+    "vad_threshold_db": -40,                     # voice-activity level (dBFS) for --vad
+    "tenths_sec": 0,                             # show tenths in a zone's last N seconds; 0 = off
 }
+LOW_POWER_FPS = 4   # pulse frame rate while the window is minimized or hidden
+TENTHS_SEC    = 10  # tenths window used when the Settings switch turns the mode on
+INBOX_POLL_MS = (20, 250)   # Windows inbox poll: fastest while busy, backing off to the slowest when idle
 # Zoom is derived from window width at runtime
 BASE_WIDTH = 560   # px at fs=1.0
 MIN_WIDTH  = 400
 MAX_WIDTH  = 1100
+INITIAL_FS = 1.4   # launch scale (~784px wide)
+
+_UMASK = os.umask(0); os.umask(_UMASK)   # read once here: os.umask() can't be queried without setting it
+
+def write_json_atomic(path, data):
+    """Write JSON to a temp file beside path, fsync it and os.replace() it in; raises on failure.
+
+    The temp file from mkstemp is 0600, so it is first given the existing
+    file's mode (or the umask default for a new file) to keep permissions.
+    """
+    fd, tmp = tempfile.mkstemp(prefix="." + os.path.basename(path) + "-", suffix=".tmp",
+                               dir=os.path.dirname(path) or ".")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f, indent=2); f.flush(); os.fsync(f.fileno())
+        try: mode = os.stat(path).st_mode & 0o7777
+        except OSError: mode = 0o666 & ~_UMASK
+        os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except BaseException:
+        try: os.remove(tmp)
+        except OSError: pass
+        raise
+
+class _SettingsStore:
+    """In-memory settings with a debounced, atomic write-behind to disk.
+
+    The file is read at most once per process. save() only updates the
+    in-memory copy and wakes a writer thread, which waits until saves stop
+    arriving for `delay` seconds and then writes the latest copy to a temp
+    file and os.replace()s it over the real one, so a slow disk never
+    blocks the Tk thread and a crash mid-write can't truncate the file.
+    """
+    def __init__(self, path, delay=0.5):
+        self.path = path; self.delay = delay
+        self._data = None; self._dirty = False
+        self._lock = threading.Lock(); self._write_lock = threading.Lock()
+        self._wake = threading.Event(); self._thread = None
+
+    def load(self):
+        with self._lock:
+            if self._data is None: self._data = self._read()
+            return self._data.copy()
+
+    def _read(self):
+        if os.path.exists(self.path):
+            try:
+                s = DEFAULT_SETTINGS.copy()
+                with open(self.path) as f: s.update(json.load(f))
+                # Remove legacy zoom key — window resize drives zoom now
+                s.pop("zoom", None)
+                return s
+            except Exception: pass
+        return DEFAULT_SETTINGS.copy()
+
+    def save(self, s):
+        with self._lock:
+            self._data = dict(s); self._dirty = True
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+        self._wake.set()
+
+    def _run(self):
+        while True:
+            self._wake.wait()
+            while True:                      # coalesce a burst of saves into one write
+                self._wake.clear()
+                if not self._wake.wait(self.delay): break
+            self.flush()
+
+    def flush(self):
+        """Write pending changes now (called by the writer thread and at exit)."""
+        with self._write_lock:
+            with self._lock:
+                if not self._dirty: return
+                data = self._data.copy(); self._dirty = False
+            try: write_json_atomic(self.path, data)
+            except Exception:
+                with self._lock: self._dirty = True   # retry on the next save or at exit; _data may be newer
+
+SETTINGS = _SettingsStore(SETTINGS_FILE)
+atexit.register(SETTINGS.flush)
 
 def load_settings():
-    if os.path.exists(SETTINGS_FILE):
-        try:
-            s = DEFAULT_SETTINGS.copy()
-            with open(SETTINGS_FILE) as f: s.update(json.load(f))
-            # Remove legacy zoom key — window resize drives zoom now
-            s.pop("zoom", None)
-            return s
-        except Exception: pass
-    return DEFAULT_SETTINGS.copy()
+    return SETTINGS.load()
 
 def save_settings(s):
-    try:
-        with open(SETTINGS_FILE, "w") as f: json.dump(s, f, indent=2)
-    except Exception: pass
+    SETTINGS.save(s)
 
 # ── Colour palettes ───────────────────────────────────────────────────────
 PALETTE = {
@@ -102,43 +274,734 @@ PALETTE = {
 
 def get_palette(theme, sys_dark=True):
     if theme == "system":
-        return PALETTE["dark"] if sys_dark else PALETTE["light"]
-    return PALETTE.get(theme, PALETTE["dark"])
+        pal = PALETTE["dark"] if sys_dark else PALETTE["light"]
+    else:
+        pal = PALETTE.get(theme, PALETTE["dark"])
+    get_ramps(pal)   # build the animation tables once, when a palette is first picked
+    return pal
+
+# Button looks by role: (fg, hover, text); "@key" reads the palette, anything else is fixed
+BUTTON_STYLES = {
+    "start":     ("@btn_start_bg", "#27a85e", "@btn_start_fg"),
+    "start_off": ("#1a2e1a", "#1a2e1a", "#2a4a2a"),
+    "pause":     ("#e67e22", "#ca6f1e", "#ffffff"),
+    "stop":      ("@btn_stop_bg", "#c0392b", "@btn_stop_fg"),
+    "stop_off":  ("#2a1a1a", "#2a1a1a", "#553333"),
+    "spk_off":   ("#2a1a00", "#2a1a00", "#3a2a00"),
+    "next":      ("@btn_next_bg", "#2a7ac0", "@btn_next_fg"),
+    "next_off":  ("#1a2030", "#1a2030", "#2a3a50"),
+    "save":      ("#27a85e", "#1e8449", "#ffffff"),
+}
+
+def button_colors(c, role):
+    """CTkButton colour options for a BUTTON_STYLES role under palette c."""
+    pick = lambda v: c[v[1:]] if v[0] == "@" else v
+    fg, hover, text = BUTTON_STYLES[role]
+    return {"fg_color": pick(fg), "hover_color": pick(hover), "text_color": pick(text)}
+
+THEME_POLL_SEC = 5.0   # OS light/dark poll interval where darkdetect has no listener
+
+class _OsThemeWatch:
+    """Daemon thread: callback(is_dark) on OS appearance changes between start() and stop() (may repeat)."""
+    def __init__(self, callback, poll_sec=THEME_POLL_SEC):
+        self.callback = callback; self.poll_sec = poll_sec
+        self._active = threading.Event(); self._thread = None; self._listening = False
+
+    def start(self):
+        """Watch (again); a resumed listener re-reads the current mode, which may have changed meanwhile."""
+        if self._active.is_set(): return
+        self._active.set()
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, daemon=True, name="theme-watch")
+            self._thread.start()
+        elif self._listening: threading.Thread(target=self._read_once, daemon=True).start()
+
+    def stop(self):
+        """Stop reporting; the poll loop sleeps, a darkdetect listener (which can't be interrupted) goes quiet."""
+        self._active.clear()
+
+    def _notify(self, dark):
+        if self._active.is_set(): self.callback(dark)
+
+    def _read_once(self):
+        try:
+            import darkdetect; dark = darkdetect.isDark()
+        except Exception: return
+        if dark is not None: self._notify(bool(dark))
+
+    def _run(self):
+        try: import darkdetect
+        except Exception: return
+        # darkdetect's macOS listener re-runs sys.executable, which is the app itself when frozen
+        if not (sys.platform == "darwin" and getattr(sys, "frozen", False)):
+            try:
+                self._listening = True
+                darkdetect.listener(lambda mode: self._notify(str(mode).lower() == "dark"))
+                return
+            except Exception: self._listening = False   # not supported here (or no gsettings) → poll instead
+        last = None
+        while True:
+            if not self._active.is_set(): self._active.wait(); last = None   # resumed: report afresh
+            try: dark = darkdetect.isDark()
+            except Exception: return
+            if dark is None: return      # platform can't tell
+            if dark != last: self._notify(bool(dark)); last = dark
+            time.sleep(self.poll_sec)
+
+# ── Colour ramps ──────────────────────────────────────────────────────────
+PULSE_STEPS = 16   # pulse brightness runs 0..1 in 1/PULSE_STEPS steps, one per frame
+
+class _Ramps:
+    """Pre-blended colours for one palette, so animation frames are table lookups.
+
+    The pulse tables are indexed by pulse step (0..PULSE_STEPS); the stage
+    tables give the progress-bar track and fill colour per stage.
+    """
+    def __init__(self, c):
+        alphas = [i / PULSE_STEPS for i in range(PULSE_STEPS + 1)]
+        self.digit   = tuple(_blend(c["red"], "#ffffff", a) for a in alphas)
+        self.marker  = tuple(_blend(c["red"], c["zone_bg"], 1.0 - a*0.9) for a in alphas)
+        self.zone_bg = tuple(_blend(c["bg_red"], c["zone_bg"], 1.0 - a*0.6) for a in alphas)
+        self.track = {"great":  c["bar_track"],
+                      "yellow": _blend(c["yellow"], c["zone_bg"], 0.85),
+                      "red":    _blend(c["red"], c["zone_bg"], 0.85),
+                      "done":   _blend(c["red"], c["zone_bg"], 0.80)}
+        self.fill  = {"great": c["green"], "yellow": c["yellow"], "red": c["red"], "done": c["red"]}
+
+_RAMPS = {}   # id(palette dict) -> _Ramps
+
+def get_ramps(c):
+    r = _RAMPS.get(id(c))
+    if r is None: r = _RAMPS[id(c)] = _Ramps(c)
+    return r
+
+# ── Timing engine (headless — no Tk required) ─────────────────────────────
+class ZoneClock:
+    """Countdown for one zone, measured against monotonic deadlines.
+
+    Elapsed time only accrues while the zone is running, so pausing and
+    resuming never loses or double-counts a partial second, and a stalled
+    caller simply reads a larger elapsed value on its next poll.
+    """
+    def __init__(self, clock=time.monotonic):
+        self.clock = clock; self.total_sec = 0
+        self._acc = 0.0; self._since = None   # _since: clock() at the start of the current run
+
+    @property
+    def running(self): return self._since is not None
+
+    def set_total(self, sec):
+        self.total_sec = int(sec); self.restart()
+
+    def start(self):
+        if self._since is None: self._since = self.clock()
+
+    def pause(self):
+        if self._since is None: return
+        self._acc += self.clock() - self._since; self._since = None
+
+    def restart(self):
+        self._acc = 0.0
+        if self._since is not None: self._since = self.clock()
+
+    def stop(self):
+        self._acc = 0.0; self._since = None
+
+    def seek(self, elapsed):
+        """Set the elapsed time directly, keeping the running/paused state."""
+        self._acc = float(elapsed)
+        if self._since is not None: self._since = self.clock()
+
+    def elapsed(self, now=None):
+        if self._since is None: return self._acc
+        return self._acc + ((self.clock() if now is None else now) - self._since)
+
+    def remain(self, now=None):
+        """Whole seconds left, as shown on the display (total - completed seconds)."""
+        return max(0, self.total_sec - int(self.elapsed(now)))
+
+    def remain_exact(self, now=None):
+        """Fractional seconds left."""
+        return max(0.0, self.total_sec - self.elapsed(now))
+
+    def until_next(self, now=None):
+        """Seconds until remain() next changes, or None if it cannot change."""
+        if self._since is None: return None
+        e = self.elapsed(now)
+        if e >= self.total_sec: return None
+        return math.floor(e) + 1 - e
+
+
+class TimerEngine:
+    """Episode + speaker countdowns for PodcastTimerApp, independent of Tk.
+
+    The widgets only display what remain() reports; nothing here decrements
+    a counter per tick, so scheduling lag can delay a repaint but never makes
+    the displayed time drift from the monotonic clock.
+    """
+    def __init__(self, clock=time.monotonic):
+        self.clock = clock
+        self.top = ZoneClock(clock); self.bot = ZoneClock(clock)
+        self.running = False; self.spk_paused = False
+
+    def start(self, top_total, bot_total):
+        self.top.stop(); self.bot.stop()
+        self.top.set_total(top_total); self.bot.set_total(bot_total)
+        self.running = True; self.spk_paused = False
+        self.top.start(); self.bot.start()
+
+    def pause(self):
+        """Pause the episode; the speaker clock always stops with it."""
+        self.running = False; self.spk_paused = False
+        self.top.pause(); self.bot.pause()
+
+    def resume(self):
+        self.running = True; self.spk_paused = False
+        self.top.start(); self.bot.start()
+
+    def pause_speaker(self):
+        self.spk_paused = True; self.bot.pause()
+
+    def resume_speaker(self):
+        self.spk_paused = False
+        if self.running: self.bot.start()
+
+    def next_speaker(self):
+        """Restart the speaker countdown from its full duration (and un-pause it)."""
+        self.spk_paused = False; self.bot.restart()
+        if self.running: self.bot.start()
+
+    def reset(self):
+        self.running = False; self.spk_paused = False
+        self.top.stop(); self.bot.stop()
+
+    def remain(self):
+        """(top, bot) whole seconds remaining, sampled at a single instant."""
+        now = self.clock()
+        return self.top.remain(now), self.bot.remain(now)
+
+    def until_next(self):
+        """Seconds until either displayed value changes, or None if both are idle."""
+        now = self.clock()
+        waits = [w for w in (self.top.until_next(now), self.bot.until_next(now)) if w is not None]
+        return min(waits) if waits else None
+
+    def snapshot(self, now=None):
+        """Plain-dict state that restore() can rebuild (JSON-serializable)."""
+        if now is None: now = self.clock()
+        return {"top_total": self.top.total_sec, "bot_total": self.bot.total_sec,
+                "top_el": round(self.top.elapsed(now), 3), "bot_el": round(self.bot.elapsed(now), 3),
+                "running": self.running, "spk_paused": self.spk_paused}
+
+    def restore(self, snap, at=None):
+        """Rebuild from snapshot(); if `at` (the clock() time it was taken) is given,
+        running zones are advanced by the time since."""
+        top_el, bot_el = self._projected(snap, at)
+        self.reset()
+        self.top.total_sec = int(snap["top_total"]); self.bot.total_sec = int(snap["bot_total"])
+        self.top.seek(top_el); self.bot.seek(bot_el)
+        self.running = bool(snap["running"]); self.spk_paused = bool(snap["spk_paused"])
+        if self.running:
+            self.top.start()
+            if not self.spk_paused: self.bot.start()
+
+    def drift(self, snap, at):
+        """Largest elapsed-time difference (s) from a snapshot taken at `at`, or None
+        if totals or running/paused state differ."""
+        if (self.top.total_sec, self.bot.total_sec, self.running, self.spk_paused) != (
+                int(snap["top_total"]), int(snap["bot_total"]), bool(snap["running"]), bool(snap["spk_paused"])):
+            return None
+        now = self.clock(); top_el, bot_el = self._projected(snap, at)
+        return max(abs(self.top.elapsed(now) - top_el), abs(self.bot.elapsed(now) - bot_el))
+
+    def _projected(self, snap, at):
+        top_el, bot_el = float(snap["top_el"]), float(snap["bot_el"])
+        if at is not None and snap["running"]:
+            gap = max(0.0, self.clock() - at); top_el += gap
+            if not snap["spk_paused"]: bot_el += gap
+        return top_el, bot_el
+
+
+THRESH_YELLOW = 0.75   # fraction of the zone's time used
+THRESH_RED    = 0.90
+
+def stage_for(remain, total):
+    """Display stage for a zone with `remain` of `total` whole seconds left."""
+    pct = 1.0-(remain/total) if total > 0 else 0.0
+    return ("done" if remain == 0 else "red" if pct >= THRESH_RED else
+            "yellow" if pct >= THRESH_YELLOW else "great")
+
+def tick_decision(stages, remain, totals):
+    """One display tick for both zones (PodcastTimerApp._tick and simulate_episode): each zone's
+    new stage, or None if unchanged or skipped (old stage None), and the single cue to play —
+    zones crossing together play only the most urgent one, as AudioWorker merges them."""
+    new = tuple(None if old is None or stage_for(r, t) == old else stage_for(r, t)
+                for old, r, t in zip(stages, remain, totals))
+    cues = [st for st in new if st in CUE_TONES]
+    return new, (max(cues, key=CUE_PRIORITY.get) if cues else None)
+
+
+class SimClock:
+    """Virtual monotonic clock for TimerEngine: call it for the time, advance() to move it."""
+    def __init__(self, start=0.0): self.now = float(start)
+
+    def __call__(self): return self.now
+
+    def advance(self, sec):
+        self.now += sec; return self.now
+
+
+SIM_ACTIONS = {"pause": "pause", "resume": "resume", "spk_pause": "pause_speaker",
+               "spk_resume": "resume_speaker", "next": "next_speaker"}
+
+def simulate_episode(top_total, bot_total, script=(), auto_next=None, until=None):
+    """Fast-forward a whole session on a SimClock and return its event timeline.
+
+    script is a list of (t_sec, action) with actions from SIM_ACTIONS, applied
+    in time order; auto_next presses NEXT that many seconds after the speaker
+    timer runs out. The engine is stepped to every displayed-second change,
+    like PodcastTimerApp._tick, until the episode is done, `until` seconds
+    pass, or nothing can change. Events are dicts {"t", "ev", ...}: "start",
+    the script actions, "stage" (zone, stage) and "cue" (yellow/red/done —
+    the beep the app would play, decided by tick_decision like _tick).
+    """
+    clock = SimClock(); eng = TimerEngine(clock)
+    script = sorted(script, key=lambda a: a[0]); si = 0
+    eng.start(top_total, bot_total)
+    stages = {"top": "great", "bot": "great"}; shown = dict(zip(("top", "bot"), eng.remain()))
+    events = [{"t": 0.0, "ev": "start", "top_total": top_total, "bot_total": bot_total}]
+    next_at = None
+    def act(name):
+        getattr(eng, SIM_ACTIONS[name])()
+        events.append({"t": round(clock.now, 3), "ev": name})
+        if name == "next":
+            stages["bot"] = "great"; shown["bot"] = eng.remain()[1]
+    while True:
+        due = []
+        w = eng.until_next()
+        if w is not None: due.append(clock.now + w + 0.001)
+        if si < len(script): due.append(max(clock.now, script[si][0]))
+        if next_at is not None: due.append(next_at)
+        if not due: break
+        t = min(due)
+        if until is not None and t > until: break
+        clock.advance(t - clock.now)
+        while si < len(script) and script[si][0] <= clock.now:
+            act(script[si][1]); si += 1
+        if next_at is not None and next_at <= clock.now:
+            next_at = None; act("next")
+        rem = dict(zip(("top", "bot"), eng.remain()))
+        zones = [z for z in ("top", "bot") if rem[z] != shown[z]]
+        shown.update(rem)
+        new, cue = tick_decision([stages[z] for z in zones], [rem[z] for z in zones],
+                                 [eng.top.total_sec if z == "top" else eng.bot.total_sec for z in zones])
+        t = round(clock.now, 3)
+        for zone, st in zip(zones, new):
+            if st is None: continue
+            stages[zone] = st
+            events.append({"t": t, "ev": "stage", "zone": zone, "stage": st})
+            if zone == "bot" and st == "done" and auto_next is not None:
+                next_at = clock.now + auto_next
+        if cue: events.append({"t": t, "ev": "cue", "cue": cue})
+        if stages["top"] == "done": break
+    return events
+
+# ── Session journal ───────────────────────────────────────────────────────
+JOURNAL_FILE = os.path.join(DATA_DIR, "session.journal")
+SNAPSHOT_SEC = 15   # full-state "snap" line at least this often while the clock runs
+
+class SessionJournal:
+    """Append-only JSON-lines log of the current session, for crash recovery.
+
+    record() just appends to an in-memory buffer; a writer thread flushes
+    it in batches (every `flush_sec`, or sooner once `flush_max` lines are
+    waiting), so journaling adds a list append to _tick. Each line carries
+    the engine clock ("m"), and periodic "snap" lines hold the full engine
+    state, so recover() only replays the events after the last snapshot.
+    """
+    def __init__(self, path, flush_sec=2.0, flush_max=64):
+        self.path = path; self.flush_sec = flush_sec; self.flush_max = flush_max
+        self._buf = []; self._truncate = False
+        self._lock = threading.Lock(); self._write_lock = threading.Lock()
+        self._wake = threading.Event(); self._thread = None
+
+    def begin(self, m, top_total, bot_total):
+        """Start a new session: the file is replaced on the next flush."""
+        with self._lock: self._buf = []; self._truncate = True
+        self.record("start", m, top_total=top_total, bot_total=bot_total)
+
+    def record(self, ev, m, **data):
+        line = {"ev": ev, "t": round(time.time(), 3), "m": round(m, 3)}; line.update(data)
+        with self._lock:
+            self._buf.append(line); n = len(self._buf)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+        if n >= self.flush_max: self._wake.set()
+
+    def snapshot(self, m, snap):
+        self.record("snap", m, **snap)
+
+    def discard(self):
+        """End the session: drop buffered lines and delete the file."""
+        with self._write_lock:
+            with self._lock: self._buf = []; self._truncate = False
+            try: os.remove(self.path)
+            except OSError: pass
+
+    def _run(self):
+        while True:
+            self._wake.wait(self.flush_sec); self._wake.clear()
+            self.flush()
+
+    def flush(self):
+        with self._write_lock:
+            with self._lock:
+                lines, self._buf = self._buf, []
+                trunc, self._truncate = self._truncate, False
+            if not lines and not trunc: return
+            try:
+                with open(self.path, "w" if trunc else "a") as f:
+                    f.write("".join(json.dumps(l, separators=(",", ":")) + "\n" for l in lines))
+                    f.flush(); os.fsync(f.fileno())
+            except Exception:
+                with self._lock:                        # keep them for the next flush, unless begin() ran since
+                    if not self._truncate: self._buf[:0] = lines; self._truncate = trunc
+
+    @staticmethod
+    def recover(path):
+        """Replay a journal left by an unfinished session.
+
+        Returns (engine snapshot at the last journaled instant, wall time of
+        that line), or None if there is nothing to resume.
+        """
+        events = []
+        try:
+            with open(path) as f:
+                for ln in f:
+                    try: events.append(json.loads(ln))
+                    except ValueError: break          # torn final line from a crash
+        except OSError: return None
+        base = max((i for i, e in enumerate(events) if e.get("ev") in ("start", "snap")), default=None)
+        if base is None: return None
+        now = [0.0]; eng = TimerEngine(lambda: now[0])
+        apply = {"pause": eng.pause, "resume": eng.resume, "next": eng.next_speaker,
+                 "spk_pause": eng.pause_speaker, "spk_resume": eng.resume_speaker}
+        try:
+            for e in events[base:]:
+                now[0] = e["m"]; ev = e["ev"]
+                if ev == "start":  eng.start(e["top_total"], e["bot_total"])
+                elif ev == "snap": eng.restore(e)
+                elif ev in apply:  apply[ev]()
+        except (KeyError, TypeError, ValueError): return None
+        return eng.snapshot(), events[-1].get("t", 0)
+
+# ── Event-loop instrumentation ────────────────────────────────────────────
+HIST_EDGES_MS = (0.5, 1, 2, 4, 8, 16, 32, 64)   # bucket upper bounds; the last bucket is open
+_SPARK = " ▁▂▃▄▅▆▇█"
+
+class _RollingHist:
+    """The last `size` samples (ms) of one measurement, with percentiles and buckets on demand."""
+    def __init__(self, size=512):
+        self.samples = deque(maxlen=size); self.total = 0
+
+    def add(self, ms): self.samples.append(ms); self.total += 1
+
+    def percentile(self, q):
+        if not self.samples: return 0.0
+        v = sorted(self.samples)
+        return v[min(len(v)-1, int(q*(len(v)-1)+0.5))]
+
+    def buckets(self):
+        counts = [0]*(len(HIST_EDGES_MS)+1)
+        for ms in self.samples:
+            i = 0
+            while i < len(HIST_EDGES_MS) and ms > HIST_EDGES_MS[i]: i += 1
+            counts[i] += 1
+        return counts
+
+    def spark(self):
+        counts = self.buckets(); top = max(counts) or 1
+        return "".join(_SPARK[0 if n == 0 else max(1, round(n*8/top))] for n in counts)
+
+
+class PerfStats:
+    """Per-callback run time and after() lateness, fed by the Scheduler (Tk thread only)."""
+    def __init__(self, size=512):
+        self.size = size; self.run = {}; self.late = {}
+
+    def record(self, name, run_ms, late_ms=None):
+        h = self.run.get(name) or self.run.setdefault(name, _RollingHist(self.size))
+        h.add(run_ms)
+        if late_ms is not None:
+            h = self.late.get(name) or self.late.setdefault(name, _RollingHist(self.size))
+            h.add(max(0.0, late_ms))
+
+    def measure(self, name, fn, *args):
+        """Call fn(*args) and record its run time under name (for work not run by the Scheduler)."""
+        t = time.perf_counter()
+        try: return fn(*args)
+        finally: self.record(name, (time.perf_counter()-t)*1000)
+
+    def report(self):
+        """Multi-line text table: run and lateness p50/p99/max in ms plus a bucket sparkline."""
+        lines = [f"{'job':<10}{'n':>6} {'run p50/p99/max':>17} {'late p50/p99/max':>17}  "
+                 f"run ≤{'/'.join(f'{e:g}' for e in HIST_EDGES_MS)}ms"]
+        for name in sorted(self.run):
+            r = self.run[name]; l = self.late.get(name)
+            fmt = lambda h: (f"{h.percentile(.5):5.1f}/{h.percentile(.99):5.1f}/"
+                             f"{max(h.samples):5.1f}") if h and h.samples else f"{'-':>17}"
+            lines.append(f"{name:<10}{r.total:>6} {fmt(r):>17} {fmt(l):>17}  {r.spark()}")
+        return "\n".join(lines)
 
 # ── Audio helpers ─────────────────────────────────────────────────────────
-def _play_tone(freq, dur_ms, vol=0.45):
-    if not AUDIO_OK: return
+CUE_TONES = {"yellow": (660, 180), "red": (440, 220), "done": (330, 300)}   # (Hz, ms)
+
+def _synth_tone(freq, dur_ms, vol):
+    import numpy as np
+    sr = 44100; n = int(sr * dur_ms / 1000)
+    t  = np.linspace(0, dur_ms/1000, n, False)
+    wave = np.sin(2 * np.pi * freq * t)
+    fade_start = int(n * 0.8)
+    wave[fade_start:] *= np.linspace(1, 0, n - fade_start)
+    wave = (wave * vol * 32767).astype(np.int16)
+    stereo = np.column_stack([wave, wave])
+    return pygame.sndarray.make_sound(stereo)
+
+class _ToneCache:
+    """Bounded LRU of ready-to-play pygame Sounds keyed by (freq, dur_ms, vol)."""
+    def __init__(self, max_size=16):
+        self.max_size = max_size; self._sounds = OrderedDict(); self._lock = threading.Lock()
+
+    def get(self, freq, dur_ms, vol=0.45):
+        key = (freq, dur_ms, vol)
+        with self._lock:
+            snd = self._sounds.get(key)
+            if snd is not None:
+                self._sounds.move_to_end(key); return snd
+        snd = _synth_tone(freq, dur_ms, vol)   # synthesize outside the lock
+        with self._lock:
+            self._sounds[key] = snd
+            while len(self._sounds) > self.max_size: self._sounds.popitem(last=False)
+        return snd
+
+    def warm(self, tones=None):
+        """Pre-synthesize the cue tones; call from a worker thread once the mixer is up."""
+        if not AUDIO_OK: return
+        for freq, dur_ms in (tones or CUE_TONES.values()):
+            try: self.get(freq, dur_ms)
+            except Exception: pass
+
+    def __len__(self): return len(self._sounds)
+
+TONES = _ToneCache()
+
+CUE_PRIORITY   = {"yellow": 1, "red": 2, "done": 3}   # cues that coincide: the most urgent one plays
+CUE_OFFSETS_MS = {"done": (0, 380)}                   # beep start times within a cue (default: one at 0)
+CUE_MERGE_MS   = 50     # cues requested this close together are merged into one
+AUDIO_WAKE_MS  = 20 if sys.platform == "win32" else 2   # wake this far ahead of a beep (covers coarse timers)
+AUDIO_SLICE_SEC = 0.0005   # then sleep in slices this long until it is due; the GIL stays free
+AUDIO_BUSY_SEC  = 0.005    # poll interval while the previous beep is still playing
+
+def _fine_timer(on):
+    """Windows: 1 ms sleep granularity, only around a beep (timeBeginPeriod costs power system-wide)."""
+    if sys.platform != "win32": return
     try:
-        import numpy as np
-        sr = 44100; n = int(sr * dur_ms / 1000)
-        t  = np.linspace(0, dur_ms/1000, n, False)
-        wave = np.sin(2 * np.pi * freq * t)
-        fade_start = int(n * 0.8)
-        wave[fade_start:] *= np.linspace(1, 0, n - fade_start)
-        wave = (wave * vol * 32767).astype(np.int16)
-        stereo = np.column_stack([wave, wave])
-        snd = pygame.sndarray.make_sound(stereo)
-        snd.play()
+        import ctypes; winmm = ctypes.windll.winmm
+        (winmm.timeBeginPeriod if on else winmm.timeEndPeriod)(1)
     except Exception: pass
 
-def beep_yellow(): threading.Thread(target=_play_tone, args=(660, 180), daemon=True).start()
-def beep_red():    threading.Thread(target=_play_tone, args=(440, 220), daemon=True).start()
-def beep_done():
-    threading.Thread(target=_play_tone, args=(330, 300), daemon=True).start()
-    threading.Timer(0.38, lambda: threading.Thread(target=_play_tone, args=(330,300),daemon=True).start()).start()
+class AudioWorker:
+    """Audio thread: plays cue beeps from a due-time queue on one reserved channel, merging
+    cues within CUE_MERGE_MS and holding a beep until the one before it has finished."""
+    def __init__(self):
+        self._cv = threading.Condition(); self._heap = []; self._seq = 0
+        self._last = None                  # (requested at, priority, entries) of the newest cue
+        self._thread = None; self.played = 0; self.merged = 0
+        self.late = _RollingHist(256)      # ms between a beep's due time and Channel.play() returning
+
+    def start(self):
+        """Start the thread once the mixer is up (idempotent); cues before then are dropped."""
+        with self._cv:
+            if self._thread is None and AUDIO_OK:
+                self._thread = threading.Thread(target=self._run, daemon=True, name="audio")
+                self._thread.start()
+
+    def cue(self, name, vol=0.45):
+        if self._thread is None or name not in CUE_TONES: return
+        now = time.perf_counter(); pri = CUE_PRIORITY.get(name, 0)
+        freq, dur_ms = CUE_TONES[name]
+        with self._cv:
+            last = self._last
+            if last and now - last[0] < CUE_MERGE_MS / 1000:
+                if pri <= last[1]: self.merged += 1; return
+                for e in last[2]: e[-1] = False        # superseded: drop its unplayed beeps
+                self.merged += 1
+            entries = []
+            for off in CUE_OFFSETS_MS.get(name, (0,)):
+                self._seq += 1
+                e = [now + off / 1000, self._seq, freq, dur_ms, vol, True]
+                heapq.heappush(self._heap, e); entries.append(e)
+            self._last = (now, pri, entries)
+            self._cv.notify()
+
+    @property
+    def depth(self):
+        with self._cv: return sum(1 for e in self._heap if e[-1])
+
+    def report(self):
+        """One line for the perf overlay: queue depth, beeps played/merged and lateness."""
+        with self._cv:
+            h = self.late
+            lat = (f"{h.percentile(.5):.1f}/{h.percentile(.99):.1f}/{max(h.samples):.1f}"
+                   if h.samples else "-")
+        return f"audio     queue {self.depth}  played {self.played}  merged {self.merged}  late p50/p99/max {lat} ms"
+
+    def _run(self):
+        try: pygame.mixer.set_reserved(1); ch = pygame.mixer.Channel(0)
+        except Exception: ch = None
+        ahead = AUDIO_WAKE_MS / 1000
+        while True:
+            with self._cv:
+                while not self._heap: self._cv.wait()
+                wait = self._heap[0][0] - time.perf_counter() - ahead
+                if wait > 0:
+                    self._cv.wait(wait); continue       # re-check: an earlier cue may have arrived
+                e = heapq.heappop(self._heap)
+            if not e[-1]: continue
+            try:
+                snd = TONES.get(e[2], e[3], e[4])
+                while ch is not None and ch.get_busy(): time.sleep(AUDIO_BUSY_SEC)   # don't cut a beep off
+            except Exception: continue
+            _fine_timer(True)
+            try:
+                while time.perf_counter() < e[0]: time.sleep(AUDIO_SLICE_SEC)
+                ch.play(snd) if ch is not None else snd.play()
+            except Exception: continue
+            finally: _fine_timer(False)
+            late = (time.perf_counter() - e[0]) * 1000
+            with self._cv: self.late.add(late); self.played += 1
+
+AUDIO = AudioWorker()
+
+
+# ── Shape cache ───────────────────────────────────────────────────────────
+class _ShapeCache:
+    """Canvas geometry computed once per key, e.g. ("pencil", size, hover).
+
+    Values are whatever the builder returns (coordinate tuples, item specs);
+    every key depends on the zoom factor or palette, so set_scale() and
+    set_palette() drop the whole cache when either changes.
+    """
+    def __init__(self, max_size=4096):
+        self._items = {}; self.max_size = max_size
+        self.scale = None; self.palette = None; self.builds = 0
+
+    def get(self, key, build, *args):
+        v = self._items.get(key)
+        if v is None:
+            if len(self._items) >= self.max_size: self._items.clear()   # e.g. a long drag-resize
+            v = self._items[key] = build(*args); self.builds += 1
+        return v
+
+    def set_scale(self, fs):
+        if fs != self.scale: self.scale = fs; self._items.clear()
+
+    def set_palette(self, c):
+        if c is not self.palette: self.palette = c; self._items.clear()
+
+    def __len__(self): return len(self._items)
+
+SHAPES = _ShapeCache()
 
 # ── Canvas helpers ────────────────────────────────────────────────────────
-def _rrect(cv, x0, y0, x1, y1, r, **kw):
+def _rrect_coords(x0, y0, x1, y1, r):
+    """Boxes for the 4 corner arcs (TL, TR, BL, BR) and 2 cross rectangles of a rounded rect."""
+    return SHAPES.get(("rrect", x0, y0, x1, y1, r), _rrect_boxes, x0, y0, x1, y1, r)
+
+def _rrect_boxes(x0, y0, x1, y1, r):
     r = max(1, min(r, (x1-x0)//2, (y1-y0)//2))
-    cv.create_arc(x0,y0,x0+2*r,y0+2*r,start=90, extent=90,style="pieslice",**kw)
-    cv.create_arc(x1-2*r,y0,x1,y0+2*r,start=0,  extent=90,style="pieslice",**kw)
-    cv.create_arc(x0,y1-2*r,x0+2*r,y1,start=180,extent=90,style="pieslice",**kw)
-    cv.create_arc(x1-2*r,y1-2*r,x1,y1,start=270,extent=90,style="pieslice",**kw)
-    cv.create_rectangle(x0+r,y0,x1-r,y1,**kw)
-    cv.create_rectangle(x0,y0+r,x1,y1-r,**kw)
+    return ((x0,y0,x0+2*r,y0+2*r), (x1-2*r,y0,x1,y0+2*r),
+            (x0,y1-2*r,x0+2*r,y1), (x1-2*r,y1-2*r,x1,y1),
+            (x0+r,y0,x1-r,y1),     (x0,y0+r,x1,y1-r))
 
-def _vbar(cv, x, y0, y1, col):
-    cv.create_rectangle(x-1, y0, x+2, y1, fill=col, outline="")
+def _rrect(cv, x0, y0, x1, y1, r, **kw):
+    """Draw a rounded rect from 6 canvas items; returns their ids in _rrect_coords order."""
+    boxes = _rrect_coords(x0, y0, x1, y1, r)
+    ids = [cv.create_arc(*b, start=st, extent=90, style="pieslice", **kw)
+           for b, st in zip(boxes, (90, 0, 180, 270))]
+    return ids + [cv.create_rectangle(*b, **kw) for b in boxes[4:]]
+
+def _vbar(cv, x, y0, y1, col, **kw):
+    return cv.create_rectangle(x-1, y0, x+2, y1, fill=col, outline="", **kw)
+
+class _BarRenderer:
+    """Progress bar built from a fixed set of canvas items.
+
+    The items are created once per canvas width (rebuild()); each frame after
+    that only moves the fill's edge and recolours by tag, and any coords or
+    itemconfigure call whose value is already applied is skipped.
+    """
+    MARKS = (THRESH_YELLOW, THRESH_RED)
+
+    def __init__(self, cv, fs):
+        self.cv = cv; self.fs = fs; self.W = 0
+        self._fill = (); self._applied = {}; self.calls = 0   # calls: Tk calls made by draw()
+
+    def set_scale(self, fs):
+        self.fs = fs
+        if self.W: self.rebuild(self.W)
+
+    def resize(self, W):
+        """Rebuild for a new canvas width; returns True if anything changed."""
+        if W == self.W: return False
+        self.rebuild(W); return True
+
+    def rebuild(self, W):
+        cv = self.cv; cv.delete("all")
+        self.W = W; self._applied = {}; self._fill = ()
+        if W < 4: return
+        fs = self.fs; bh = int(12*fs); y0 = int(8*fs); y1 = y0+bh
+        self._y0, self._y1, self._r = y0, y1, bh//2
+        _rrect(cv, 0, y0, W, y1, self._r, fill="", outline="", tags="track")
+        self._fill = _rrect(cv, 0, y0, W, y1, self._r, fill="", outline="",
+                            state="hidden", tags="fill")
+        self._applied["fill"] = {"state": "hidden"}
+        ex = int(5*fs)
+        for i, f in enumerate(self.MARKS):
+            _vbar(cv, int(W*f), y0-ex, y1+ex, "", tags=f"mark{i}")
+        ex2 = int(7*fs)
+        cv.create_rectangle(W-5, y0-ex2, W, y1+ex2, fill="", outline="",
+                            state="hidden", tags="pulse")
+        self._applied["pulse"] = {"state": "hidden"}
+
+    def draw(self, pct, track_col, fill_col, mark_cols, pulse_col):
+        """mark_cols holds a colour per MARKS entry (None hides it); pulse_col None hides the pulse."""
+        if not self._fill: return
+        self._cfg("track", fill=track_col)
+        fw = int(self.W*pct)
+        if fw > 2:
+            # the fill width changes every tick: compute its boxes directly, not via SHAPES
+            for item, box in zip(self._fill, _rrect_boxes(0, self._y0, fw, self._y1, self._r)):
+                self._coords(item, box)
+            self._cfg("fill", fill=fill_col, state="normal")
+        else:
+            self._cfg("fill", state="hidden")
+        for i, col in enumerate(mark_cols):
+            if col is None: self._cfg(f"mark{i}", state="hidden")
+            else:           self._cfg(f"mark{i}", fill=col, state="normal")
+        if pulse_col is None: self._cfg("pulse", state="hidden")
+        else:                 self._cfg("pulse", fill=pulse_col, state="normal")
+
+    def _cfg(self, tag, **kw):
+        applied = self._applied.setdefault(tag, {})
+        diff = {k: v for k, v in kw.items() if applied.get(k) != v}
+        if diff:
+            self.cv.itemconfigure(tag, **diff); applied.update(diff); self.calls += 1
+
+    def _coords(self, item, box):
+        if self._applied.get(item) != box:
+            self.cv.coords(item, *box); self._applied[item] = box; self.calls += 1
 
 def _blend(h1, h2, t):
     t = max(0.0, min(1.0, t))
@@ -147,57 +1010,650 @@ def _blend(h1, h2, t):
     return "#{:02x}{:02x}{:02x}".format(
         int(r1+(r2-r1)*t), int(g1+(g2-g1)*t), int(b1+(b2-b1)*t))
 
+# ── Shared fonts ──────────────────────────────────────────────────────────
+class _FontRegistry:
+    """Process-wide CTkFonts shared by every widget, keyed by (family, base size, weight).
+
+    Sizes are given at fs=1.0; set_scale() resizes each registered font in
+    place, and CTkFont pushes the change to the widgets using it.
+    """
+    def __init__(self, family="Space Mono"):
+        self.family = family; self.scale = 1.0; self._fonts = {}
+
+    def get(self, size, weight="normal", family=None):
+        key = (family or self.family, size, weight)
+        font = self._fonts.get(key)
+        if font is None:   # created lazily — needs a Tk root to exist
+            font = self._fonts[key] = ctk.CTkFont(key[0], int(size*self.scale), weight=weight)
+        return font
+
+    def set_scale(self, fs):
+        if fs == self.scale: return
+        self.scale = fs
+        for (_, size, _), font in self._fonts.items(): font.configure(size=int(size*fs))
+
+    def __len__(self): return len(self._fonts)
+
+FONTS = _FontRegistry()
+
 # ── Canvas pencil button ──────────────────────────────────────────────────
-def _make_pencil_canvas(parent, size, bg_color, command):
-    cv = tk.Canvas(parent, width=size, height=size,
-                   bg=bg_color, highlightthickness=0, cursor="hand2")
-    def _draw(hover=False):
-        import math as _m
-        cv.delete("all")
-        s = size
-        p  = s * 0.06
-        pw = s - 2*p
-        ph = s * 0.30
-        y_mid = s * 0.50
-        y_top = y_mid - ph/2
-        y_bot = y_mid + ph/2
-        x0 = p
-        wood_w  = pw * 0.18
-        body_w  = pw * 0.50
-        ferr_w  = pw * 0.12
-        erase_w = pw * 0.20
-        cx2, cy2 = s/2, s/2
-        def rot(x, y):
-            rx = x - cx2; ry = y - cy2
-            a = _m.radians(-45)
-            return (cx2 + rx*_m.cos(a) - ry*_m.sin(a),
-                    cy2 + rx*_m.sin(a) + ry*_m.cos(a))
-        def rquad(x1, x2, yt, yb, fill, outline):
-            pts = [rot(x1,yt), rot(x2,yt), rot(x2,yb), rot(x1,yb)]
-            flat = [v for pt in pts for v in pt]
-            cv.create_polygon(flat, fill=fill, outline=outline, width=1)
-        tx = x0 + wood_w
-        tip_pts = [rot(x0, y_mid), rot(tx, y_top), rot(tx, y_bot)]
-        flat = [v for pt in tip_pts for v in pt]
-        cv.create_polygon(flat, fill="#d4956a", outline="#a06030", width=1)
-        tdx, tdy = rot(x0 + s*0.015, y_mid)
-        r = s * 0.032
-        cv.create_oval(tdx-r, tdy-r, tdx+r, tdy+r, fill="#333", outline="")
-        bx1 = x0 + wood_w; bx2 = bx1 + body_w
-        body_col = "#f5a623" if not hover else "#ffc040"
-        rquad(bx1, bx2, y_top, y_bot, body_col, "#c07800")
-        h1 = rot(bx1, y_top + ph*0.18); h2 = rot(bx2, y_top + ph*0.18)
-        cv.create_line(h1[0],h1[1], h2[0],h2[1], fill="#ffd878", width=max(1,int(s*0.035)))
-        fx1 = bx2; fx2 = fx1 + ferr_w
-        rquad(fx1, fx2, y_top, y_bot, "#b8b8b8", "#888888")
-        ex1 = fx2; ex2 = ex1 + erase_w
-        eraser_col = "#f48fb1" if not hover else "#ff6090"
-        rquad(ex1, ex2, y_top, y_bot, eraser_col, "#c06080")
-    _draw()
-    cv.bind("<Enter>",    lambda e: _draw(hover=True))
-    cv.bind("<Leave>",    lambda e: _draw(hover=False))
-    cv.bind("<Button-1>", lambda e: command())
-    return cv
+PENCIL_HOVER = {False: {"body": "#f5a623", "eraser": "#f48fb1"},
+                True:  {"body": "#ffc040", "eraser": "#ff6090"}}
+
+def _pencil_items(s, hover):
+    """(create_* kind, coords, options) for a 45° pencil in an s×s square."""
+    p  = s * 0.06
+    pw = s - 2*p
+    ph = s * 0.30
+    y_mid = s * 0.50
+    y_top = y_mid - ph/2
+    y_bot = y_mid + ph/2
+    x0 = p
+    wood_w  = pw * 0.18
+    body_w  = pw * 0.50
+    ferr_w  = pw * 0.12
+    erase_w = pw * 0.20
+    cx2, cy2 = s/2, s/2
+    a = math.radians(-45); ca, sa = math.cos(a), math.sin(a)
+    def rot(x, y):
+        rx = x - cx2; ry = y - cy2
+        return (cx2 + rx*ca - ry*sa, cy2 + rx*sa + ry*ca)
+    def rquad(x1, x2, yt, yb, fill, outline, tag=""):
+        pts = [rot(x1,yt), rot(x2,yt), rot(x2,yb), rot(x1,yb)]
+        return ("polygon", [v for pt in pts for v in pt],
+                {"fill": fill, "outline": outline, "width": 1, "tags": tag})
+    cols = PENCIL_HOVER[hover]; items = []
+    tx = x0 + wood_w
+    tip_pts = [rot(x0, y_mid), rot(tx, y_top), rot(tx, y_bot)]
+    items.append(("polygon", [v for pt in tip_pts for v in pt],
+                  {"fill": "#d4956a", "outline": "#a06030", "width": 1}))
+    tdx, tdy = rot(x0 + s*0.015, y_mid)
+    r = s * 0.032
+    items.append(("oval", [tdx-r, tdy-r, tdx+r, tdy+r], {"fill": "#333", "outline": ""}))
+    bx1 = x0 + wood_w; bx2 = bx1 + body_w
+    items.append(rquad(bx1, bx2, y_top, y_bot, cols["body"], "#c07800", "body"))
+    h1 = rot(bx1, y_top + ph*0.18); h2 = rot(bx2, y_top + ph*0.18)
+    items.append(("line", [h1[0],h1[1], h2[0],h2[1]], {"fill": "#ffd878", "width": max(1,int(s*0.035))}))
+    fx1 = bx2; fx2 = fx1 + ferr_w
+    items.append(rquad(fx1, fx2, y_top, y_bot, "#b8b8b8", "#888888"))
+    ex1 = fx2; ex2 = ex1 + erase_w
+    items.append(rquad(ex1, ex2, y_top, y_bot, cols["eraser"], "#c06080", "eraser"))
+    return items
+
+class _PencilButton(tk.Canvas):
+    """Square canvas drawing a 45° pencil from cached geometry.
+
+    The items are created once per size; hovering only recolours the
+    "body" and "eraser" items instead of redrawing.
+    """
+    def __init__(self, parent, size, bg_color, command):
+        super().__init__(parent, width=size, height=size,
+                         bg=bg_color, highlightthickness=0, cursor="hand2")
+        self.size = size; self._hover = False
+        self._draw()
+        self.bind("<Enter>",    lambda e: self._set_hover(True))
+        self.bind("<Leave>",    lambda e: self._set_hover(False))
+        self.bind("<Button-1>", lambda e: command())
+
+    def resize(self, size):
+        if size == self.size: return
+        self.size = size; self.configure(width=size, height=size); self._draw()
+
+    def _set_hover(self, hover):
+        if hover == self._hover: return
+        self._hover = hover
+        for tag, col in PENCIL_HOVER[hover].items(): self.itemconfigure(tag, fill=col)
+
+    def _draw(self):
+        self.delete("all")
+        for kind, coords, opts in SHAPES.get(("pencil", self.size, self._hover),
+                                             _pencil_items, self.size, self._hover):
+            getattr(self, "create_" + kind)(*coords, **opts)
+
+# ── Diffing view state ────────────────────────────────────────────────────
+class _ViewState:
+    """Remembers the options last applied to each widget so only changes reach Tk.
+
+    set() configures just the options whose value differs from what was last
+    applied; `calls` counts the configure calls that actually went through.
+    """
+    def __init__(self):
+        self._applied = {}; self.calls = 0
+
+    def seed(self, widget, **kw):
+        """Record options a widget was constructed with, without calling Tk."""
+        self._applied.setdefault(widget, {}).update(kw)
+
+    def set(self, widget, **kw):
+        applied = self._applied.setdefault(widget, {})
+        diff = {k: v for k, v in kw.items() if k not in applied or applied[k] != v}
+        if diff:
+            widget.configure(**diff); applied.update(diff); self.calls += 1
+
+    def get(self, widget, key, default=None):
+        """Last applied value of one option (no Tk call)."""
+        return self._applied.get(widget, {}).get(key, default)
+
+# ── Cooperative scheduler (Tk thread only) ────────────────────────────────
+class _Job:
+    """Handle for one scheduled callback; cancel() is safe to call repeatedly."""
+    def __init__(self, sched, name, interval_ms, fn, once):
+        self.sched = sched; self.name = name; self.interval_ms = interval_ms
+        self.fn = fn; self.once = once; self.handle = None; self.due = 0.0
+
+    @property
+    def active(self): return self.sched._jobs.get(self.name) is self
+
+    def cancel(self): self.sched.cancel(self.name, job=self)
+
+
+class Scheduler:
+    """Runs named jobs on the Tk event loop with after().
+
+    Each name is registered at most once: every() on a name that is already
+    running returns the existing job instead of starting a second loop, and
+    once() replaces a pending job of the same name (debounce). A periodic
+    callback may return a delay in ms to override its next interval, or
+    False to unregister itself. With a PerfStats attached, every callback's
+    run time and how late after() fired it are recorded under the job name.
+    """
+    def __init__(self, root, perf=None):
+        self.root = root; self._jobs = {}; self.perf = perf
+
+    def every(self, name, interval_ms, fn, first_ms=None):
+        if name in self._jobs: return self._jobs[name]
+        return self._add(_Job(self, name, interval_ms, fn, False),
+                         interval_ms if first_ms is None else first_ms)
+
+    def once(self, name, delay_ms, fn):
+        self.cancel(name)
+        return self._add(_Job(self, name, delay_ms, fn, True), delay_ms)
+
+    def cancel(self, name, job=None):
+        cur = self._jobs.get(name)
+        if cur is None or (job is not None and cur is not job): return False
+        del self._jobs[name]
+        if cur.handle is not None:
+            try: self.root.after_cancel(cur.handle)
+            except Exception: pass
+            cur.handle = None
+        return True
+
+    def cancel_all(self):
+        for name in list(self._jobs): self.cancel(name)
+
+    def jobs(self):
+        """{name: interval_ms} for every registered job."""
+        return {n: j.interval_ms for n, j in self._jobs.items()}
+
+    def _add(self, job, delay_ms):
+        self._jobs[job.name] = job
+        self._arm(job, delay_ms)
+        return job
+
+    def _arm(self, job, delay_ms):
+        delay_ms = max(0, int(delay_ms))
+        job.due = time.perf_counter() + delay_ms/1000
+        job.handle = self.root.after(delay_ms, self._run, job)
+
+    def _run(self, job):
+        job.handle = None
+        if not job.active: return
+        t = time.perf_counter()
+        try: nxt = job.fn()
+        except Exception:
+            nxt = None; self.root.report_callback_exception(*sys.exc_info())
+        if self.perf is not None:
+            self.perf.record(job.name, (time.perf_counter()-t)*1000, (t-job.due)*1000)
+        if not job.active: return           # fn cancelled or replaced its own job
+        if job.once or nxt is False:
+            del self._jobs[job.name]; return
+        self._arm(job, job.interval_ms if nxt is None else nxt)
+
+
+# ── Local control server (optional) ───────────────────────────────────────
+CONTROL_COMMANDS = ("start", "pause", "resume", "next", "reset", "spk_pause", "spk_resume")
+_HTTP_REASONS = {200: "OK", 202: "Accepted", 403: "Forbidden", 404: "Not Found", 405: "Method Not Allowed"}
+
+_OVERLAY_HTML = """<!doctype html><meta charset="utf-8"><title>Podcast Timer</title>
+<style>body{margin:0;background:transparent;color:#f0f0f0;font:700 64px monospace}
+div{padding:4px 12px}small{display:block;font-size:18px;color:#999}
+.yellow{color:#f1c40f}.red,.done{color:#e74c3c}</style>
+<div id="top"></div><div id="bot"></div>
+<script>
+const fmt = s => String(Math.floor(s/60)).padStart(2,"0") + ":" + String(s%60).padStart(2,"0");
+new EventSource("/events").onmessage = e => {
+  const st = JSON.parse(e.data);
+  for (const z of ["top", "bot"]) {
+    const el = document.getElementById(z), d = st[z];
+    el.className = d.stage; el.innerHTML = fmt(d.remain) + "<small>" + (d.status || st.status) + "</small>";
+  }
+};
+</script>"""
+
+class ControlServer:
+    """Localhost HTTP API (POST /api/<command>, GET /state) and SSE stream (GET /events) on an asyncio thread."""
+    def __init__(self, post, command, host="127.0.0.1", port=8765, queue_max=32):
+        self.post = post; self.command = command
+        self.host = host; self.port = port; self.queue_max = queue_max
+        self.error = None; self._loop = None; self._clients = set()
+        self._state = b"{}"; self._ready = threading.Event()
+
+    @property
+    def clients(self): return len(self._clients)
+
+    def start(self, timeout=2.0):
+        """Start the server thread; returns False (and sets .error) if it could not listen."""
+        threading.Thread(target=self._run, name="control-server", daemon=True).start()
+        self._ready.wait(timeout)
+        return self._loop is not None and self.error is None
+
+    def stop(self):
+        if self._loop is not None: self._loop.call_soon_threadsafe(self._loop.stop)
+
+    def _run(self):
+        import asyncio
+        loop = asyncio.new_event_loop()
+        try: server = loop.run_until_complete(asyncio.start_server(self._handle, self.host, self.port))
+        except OSError as e:
+            self.error = e; self._ready.set(); loop.close(); return
+        self._loop = loop; self._ready.set()
+        loop.run_forever()
+        server.close(); tasks = asyncio.all_tasks(loop)   # stop(): end open streams, then close the loop
+        for t in tasks: t.cancel()
+        if tasks: loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+        loop.close()
+
+    def publish(self, state):
+        data = json.dumps(state, separators=(",", ":")).encode()
+        if data == self._state: return
+        self._state = data
+        if self._loop is not None and self._clients:
+            self._loop.call_soon_threadsafe(self._fanout, b"data: " + data + b"\n\n")
+
+    def _fanout(self, msg):
+        for q in self._clients:
+            if q.full(): q.get_nowait()
+            q.put_nowait(msg)
+
+    async def _handle(self, reader, writer):
+        try:
+            head = (await reader.readuntil(b"\r\n\r\n")).decode("latin-1").split("\r\n")
+            method, path = head[0].split(" ")[:2]
+            length = 0; host = None
+            for h in head[1:]:
+                k, _, v = h.partition(":"); k = k.strip().lower()
+                if k == "content-length": length = int(v.strip() or 0)
+                elif k == "host": host = v.strip().lower()
+            if length: await reader.readexactly(min(length, 65536))   # body is not used
+            path = path.split("?", 1)[0].rstrip("/") or "/"
+            if host not in self._hosts():
+                self._reply(writer, 403, b'{"ok":false,"error":"forbidden host"}')
+            elif path.startswith("/api/"):
+                if method != "POST": self._reply(writer, 405, b'{"ok":false,"error":"use POST"}')
+                elif path[5:] not in CONTROL_COMMANDS: self._reply(writer, 404, b'{"ok":false,"error":"not found"}')
+                else:
+                    self.post(self.command, path[5:])
+                    self._reply(writer, 202, json.dumps({"ok": True, "command": path[5:]}).encode())
+            elif method != "GET":
+                self._reply(writer, 405, b'{"ok":false,"error":"method not allowed"}')
+            elif path == "/events": await self._stream(writer)
+            elif path == "/state": self._reply(writer, 200, self._state, cors=True)
+            elif path == "/": self._reply(writer, 200, _OVERLAY_HTML.encode(), "text/html; charset=utf-8")
+            else: self._reply(writer, 404, b'{"ok":false,"error":"not found"}')
+            await writer.drain()
+        except Exception: pass
+        finally:
+            try: writer.close()
+            except Exception: pass
+
+    def _hosts(self):
+        return {f"127.0.0.1:{self.port}", f"localhost:{self.port}", f"{self.host}:{self.port}".lower()}
+
+    def _reply(self, writer, code, body, ctype="application/json", cors=False):
+        """cors: read-only endpoints only (/state), so overlays on other origins can poll it."""
+        acao = "Access-Control-Allow-Origin: *\r\n" if cors else ""
+        writer.write(f"HTTP/1.1 {code} {_HTTP_REASONS[code]}\r\nContent-Type: {ctype}\r\n"
+                     f"Content-Length: {len(body)}\r\n{acao}"
+                     f"Connection: close\r\n\r\n".encode() + body)
+
+    async def _stream(self, writer):
+        import asyncio
+        q = asyncio.Queue(self.queue_max)
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\nCache-Control: no-cache\r\n"
+                     b"Access-Control-Allow-Origin: *\r\n\r\ndata: " + self._state + b"\n\n")
+        self._clients.add(q)
+        try:
+            while True:
+                try: msg = await asyncio.wait_for(q.get(), 15)
+                except asyncio.TimeoutError: msg = b": keep-alive\n\n"
+                writer.write(msg); await writer.drain()
+        finally: self._clients.discard(q)
+
+
+# ── OSC control (optional) ────────────────────────────────────────────────
+OSC_ROUTES = {"/timer/start": "start", "/timer/pause": "pause", "/timer/resume": "resume",
+              "/timer/next": "next", "/timer/reset": "reset", "/speaker/pause": "spk_pause",
+              "/speaker/resume": "spk_resume", "/speaker/next": "next"}
+OSC_MAX_DEPTH = 4      # nested bundles deeper than this are dropped
+
+def _osc_pad(b):
+    """NUL-terminate and pad to a multiple of 4 bytes, as OSC strings are."""
+    return b + b"\0" * (4 - len(b) % 4)
+
+def osc_message(address, *args):
+    """Encode one OSC message; args may be int, float or str."""
+    tags = ","; data = b""
+    for a in args:
+        if isinstance(a, int):     tags += "i"; data += struct.pack(">i", a)
+        elif isinstance(a, float): tags += "f"; data += struct.pack(">f", a)
+        else:                      tags += "s"; data += _osc_pad(str(a).encode())
+    return _osc_pad(address.encode()) + _osc_pad(tags.encode()) + data
+
+
+class OscListener:
+    """UDP socket mapping OSC addresses (OSC_ROUTES) to app commands, parsed in place in one reused buffer;
+    /timer/ping is answered with /timer/pong and stage changes go to `targets`."""
+    def __init__(self, root, post, command, port, host="", targets=(), perf=None, bufsize=4096):
+        self.root = root; self.post = post; self.command = command; self.perf = perf
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind((host, port))
+        self.buf = bytearray(bufsize); self.view = memoryview(self.buf)
+        self._routes = [(_osc_pad(a.encode()), name) for a, name in OSC_ROUTES.items()]
+        self._ping = _osc_pad(b"/timer/ping")
+        self.targets = []
+        for t in targets:
+            h, _, p = str(t).rpartition(":")
+            try: self.targets.append((h or "127.0.0.1", int(p)))
+            except ValueError: pass
+        self.received = 0; self.filehandler = False
+        if sys.platform != "win32":
+            try:
+                self.sock.setblocking(False)
+                root.tk.createfilehandler(self.sock, tk.READABLE, self._drain); self.filehandler = True
+            except Exception: self.sock.setblocking(True)
+        if not self.filehandler:
+            threading.Thread(target=self._recv_loop, args=(bytearray(bufsize),),
+                             daemon=True, name="osc").start()
+
+    def close(self):
+        if self.filehandler:
+            try: self.root.tk.deletefilehandler(self.sock)
+            except Exception: pass
+        self.sock.close()                       # also ends _recv_loop
+
+    def send(self, address, *args):
+        """Send one message to every configured target (never blocks)."""
+        if not self.targets: return
+        msg = osc_message(address, *args)
+        for t in self.targets:
+            try: self.sock.sendto(msg, t)
+            except OSError: pass
+
+    def _drain(self, *_):
+        while True:
+            try: n, addr = self.sock.recvfrom_into(self.buf)
+            except OSError: return              # BlockingIOError: nothing left to read
+            self._handle(n, addr)
+
+    def _recv_loop(self, rbuf):
+        """Worker thread (no filehandler): block on the socket, post each datagram to the Tk thread."""
+        while True:
+            try: n, addr = self.sock.recvfrom_into(rbuf)
+            except OSError: return              # socket closed
+            self.post(self._on_datagram, bytes(rbuf[:n]), addr)
+
+    def _on_datagram(self, data, addr):
+        n = len(data); self.buf[:n] = data; self._handle(n, addr)
+
+    def _handle(self, n, addr):
+        t = time.perf_counter()
+        self.received += 1
+        try: self._dispatch(0, n, addr)
+        except Exception: pass                  # malformed packet
+        if self.perf is not None: self.perf.record("osc", (time.perf_counter()-t)*1000)
+
+    def _dispatch(self, off, end, addr, depth=0):
+        buf = self.buf
+        if buf.startswith(b"#bundle\0", off, end):   # 8-byte tag, 8-byte timetag, then (int32 size, element)*
+            if depth >= OSC_MAX_DEPTH: return
+            i = off + 16
+            while i + 4 <= end:
+                size = struct.unpack_from(">i", buf, i)[0]
+                # Sizes come off the wire: a bad one drops the rest of the bundle
+                if size <= 0 or size % 4 or i + 4 + size > end: return
+                self._dispatch(i + 4, i + 4 + size, addr, depth + 1); i += 4 + size
+            return
+        if buf.startswith(self._ping, off, end):
+            buf[off+7:off+11] = b"pong"
+            try: self.sock.sendto(self.view[off:end], addr)
+            except OSError: pass
+            return
+        for route, name in self._routes:
+            if not buf.startswith(route, off, end): continue
+            if not self._pressed(off + len(route), end): return
+            self.command(name); return
+
+    def _pressed(self, i, end):
+        """False if the first argument is 0 / 0.0 / F (a button release), or the message is cut short."""
+        buf = self.buf
+        if i >= end or buf[i] != 44: return True                        # no type tags
+        z = buf.find(0, i, end)
+        if z < 0: return False                                          # truncated type tags
+        tag = buf[i+1] if z > i + 1 else 0
+        if tag in (0, 84): return True                                  # no args, or T
+        if tag == 70: return False                                      # F
+        a = i + (z - i) // 4 * 4 + 4                                    # start of the arguments
+        if a + 4 > end: return False                                    # truncated argument
+        if tag == 105: return struct.unpack_from(">i", buf, a)[0] != 0
+        if tag == 102: return struct.unpack_from(">f", buf, a)[0] != 0.0
+        return True
+
+
+# ── LAN sync (optional) ───────────────────────────────────────────────────
+SYNC_PING_SEC = 1.0    # follower → leader clock/state poll interval
+SYNC_SAMPLES  = 8      # offset estimate = lowest-delay sample of the last N
+SYNC_SLEW_MS  = 20     # a running follower re-seeks only when further off than this
+SYNC_PEER_SEC = 10     # leader pushes to followers heard from within this window
+
+class SyncLeader:
+    """Authoritative instance: answers follower pings and pushes its state over UDP.
+
+    The Tk thread calls publish() with {"status", "snap", "at"}: an engine
+    snapshot and the leader clock() time it was taken. A daemon thread
+    answers each {"op": "ping", "t0"} with NTP-style receive (t1) and
+    transmit (t2) timestamps plus the latest state, and publish() also sends
+    the state straight to recent followers so PAUSE and NEXT reach them
+    without waiting for their next poll. The network thread never touches
+    the engine.
+    """
+    def __init__(self, port, host="", clock=time.monotonic):
+        self.clock = clock; self._state = None; self._peers = {}
+        self._lock = threading.Lock()
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind((host, port)); self.sock.settimeout(0.5)
+        threading.Thread(target=self._run, name="sync-leader", daemon=True).start()
+
+    @property
+    def followers(self):
+        now = time.monotonic()
+        with self._lock: return [a for a, seen in self._peers.items() if now - seen < SYNC_PEER_SEC]
+
+    def publish(self, state):
+        with self._lock: self._state = state
+        peers = self.followers
+        if not peers: return
+        msg = json.dumps(dict(state, op="state")).encode()
+        for a in peers:
+            try: self.sock.sendto(msg, a)
+            except OSError: pass
+
+    def _run(self):
+        while True:
+            try: data, addr = self.sock.recvfrom(2048)
+            except socket.timeout: continue
+            except OSError: return
+            t1 = self.clock()
+            try: req = json.loads(data)
+            except ValueError: continue
+            if not isinstance(req, dict) or req.get("op") != "ping": continue
+            with self._lock: self._peers[addr] = time.monotonic(); state = self._state
+            reply = dict(state or {}, op="pong", t0=req.get("t0"), t1=t1)
+            reply["t2"] = self.clock()
+            try: self.sock.sendto(json.dumps(reply).encode(), addr)
+            except OSError: pass
+
+
+def sync_durations(st):
+    """(top, bot) configured seconds from a leader state, or None if the leader has none to offer."""
+    totals = st.get("totals") or (st["snap"]["top_total"], st["snap"]["bot_total"])
+    tt, bt = int(totals[0]), int(totals[1])
+    return (tt, bt) if tt > 0 and bt > 0 else None
+
+
+class SyncFollower:
+    """Tracks a SyncLeader's clock and state from another instance.
+
+    Every SYNC_PING_SEC it pings the leader; for each pong
+    offset = ((t1 - t0) + (t2 - t3)) / 2 and delay = (t3 - t0) - (t2 - t1),
+    and the estimate in use is the lowest-delay sample of the last
+    SYNC_SAMPLES (least queueing, so least asymmetry). clock() is the local
+    monotonic clock shifted onto the leader's timeline, so an engine driven
+    by it can restore leader snapshots directly. on_state(state) is called on
+    the follower thread for every state received once an offset is known.
+    """
+    def __init__(self, leader, on_state, local=time.monotonic):
+        host, _, port = leader.rpartition(":")
+        self.leader = (host or "127.0.0.1", int(port)); self.on_state = on_state; self.local = local
+        self.offset = 0.0; self.delay = None
+        self._samples = deque(maxlen=SYNC_SAMPLES)
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM); self.sock.settimeout(0.1)
+        threading.Thread(target=self._run, name="sync-follower", daemon=True).start()
+
+    def clock(self): return self.local() + self.offset
+
+    def _run(self):
+        next_ping = 0.0
+        while True:
+            now = self.local()
+            if now >= next_ping:
+                next_ping = now + SYNC_PING_SEC
+                try: self.sock.sendto(json.dumps({"op": "ping", "t0": now}).encode(), self.leader)
+                except OSError: pass
+            try: data, _ = self.sock.recvfrom(4096)
+            except socket.timeout: continue
+            except OSError:
+                time.sleep(0.1); continue         # e.g. ICMP port unreachable while the leader is down
+            t3 = self.local()
+            try: msg = json.loads(data)
+            except ValueError: continue
+            if not isinstance(msg, dict): continue
+            if msg.get("op") == "pong" and isinstance(msg.get("t0"), float):
+                t0, t1, t2 = msg["t0"], msg["t1"], msg["t2"]
+                self._samples.append(((t3 - t0) - (t2 - t1), ((t1 - t0) + (t2 - t3)) / 2))
+                self.delay, self.offset = min(self._samples)
+            if self.delay is not None and "snap" in msg: self.on_state(msg)
+
+
+# ── Voice activity (optional) ─────────────────────────────────────────────
+VAD_FRAME_MS  = 20     # RMS analysis frame
+VAD_ATTACK_MS = 100    # this much continuous voice counts as talking...
+VAD_HANG_MS   = 800    # ...and this much silence as stopped
+VAD_RING_SEC  = 2.0    # analysis ring buffer length (bounds memory)
+
+class VoiceActivity:
+    """Energy-based voice activity detector on a worker thread.
+
+    Audio arrives in blocks, either from a WAV file read at real-time pace
+    (a stand-in for a microphone) or from the microphone through the
+    optional `sounddevice` package. Each block is mixed to mono float32 and
+    copied into a fixed ring buffer. Every complete VAD_FRAME_MS frame is
+    scored at once with a vectorised RMS in dBFS, and attack/hangover
+    smoothing turns the per-frame decisions into talking/silent transitions.
+    Only those transitions reach on_change(active), which is called on the
+    worker thread.
+    """
+    def __init__(self, on_change, source, threshold_db=-40.0, block_ms=100):
+        self.on_change = on_change; self.source = source; self.threshold_db = threshold_db
+        self.block_ms = block_ms; self.active = False; self.level_db = -120.0
+        self.error = None; self._stop = threading.Event()
+
+    def start(self):
+        threading.Thread(target=self._run, name="vad", daemon=True).start()
+
+    def stop(self): self._stop.set()
+
+    def _run(self):
+        try:
+            import numpy as np
+            blocks, rate = self._mic_blocks(np) if self.source == "mic" else self._wav_blocks(np)
+            self._analyse(np, blocks, rate)
+        except Exception as e:
+            self.error = e; print(f"Voice activity: {e}", file=sys.stderr)
+
+    def _analyse(self, np, blocks, rate):
+        frame = max(1, rate * VAD_FRAME_MS // 1000)
+        nf = max(1, int(rate * VAD_RING_SEC) // frame); size = nf * frame
+        ring = np.zeros(size, np.float32); frames = ring.reshape(nf, frame)
+        w = r = 0                                      # samples written / analysed so far
+        attack = max(1, VAD_ATTACK_MS // VAD_FRAME_MS); hang = max(1, VAD_HANG_MS // VAD_FRAME_MS)
+        run_on = run_off = 0
+        for block in blocks:
+            if self._stop.is_set(): return
+            n = len(block)
+            if n > size: block = block[-size:]; w += n - size; n = size
+            i = w % size; k = min(n, size - i)
+            ring[i:i+k] = block[:k]
+            if k < n: ring[:n-k] = block[k:]
+            w += n
+            if w - r > size: r = -(-(w - size) // frame) * frame   # overrun: skip the oldest frames
+            avail = (w - r) // frame
+            if not avail: continue
+            idx = (np.arange(avail) + r // frame) % nf
+            db = 20 * np.log10(np.sqrt(np.mean(np.square(frames[idx]), axis=1)) + 1e-9)
+            r += avail * frame; self.level_db = float(db[-1])
+            for voiced in (db > self.threshold_db).tolist():
+                if voiced: run_on += 1; run_off = 0
+                else:      run_off += 1; run_on = 0
+                if not self.active and run_on >= attack:
+                    self.active = True; self.on_change(True)
+                elif self.active and run_off >= hang:
+                    self.active = False; self.on_change(False)
+        if self.active: self.active = False; self.on_change(False)   # end of input is silence
+
+    def _wav_blocks(self, np):
+        import wave
+        wf = wave.open(self.source, "rb")
+        rate, ch, width = wf.getframerate(), wf.getnchannels(), wf.getsampwidth()
+        dtype = {1: np.uint8, 2: np.int16, 4: np.int32}.get(width)
+        if dtype is None: wf.close(); raise ValueError(f"unsupported WAV sample width: {width*8}-bit")
+        per = max(1, rate * self.block_ms // 1000)
+        def gen():
+            t = time.monotonic()
+            with wf:
+                while not self._stop.is_set():
+                    raw = wf.readframes(per)
+                    if not raw: return
+                    x = np.frombuffer(raw, dtype).astype(np.float32)
+                    x = (x - 128) / 128 if width == 1 else x / float(1 << (8*width - 1))
+                    if ch > 1: x = x.reshape(-1, ch).mean(axis=1)
+                    yield x
+                    t += len(x) / rate                  # keep microphone pace
+                    self._stop.wait(max(0.0, t - time.monotonic()))
+        return gen(), rate
+
+    def _mic_blocks(self, np, rate=16000):
+        import sounddevice as sd                        # optional: pip install sounddevice
+        per = rate * self.block_ms // 1000; q = queue.Queue(maxsize=20)
+        def cb(indata, frames, t, status):
+            try: q.put_nowait(indata[:, 0].copy())
+            except queue.Full: pass                     # analysis fell behind; drop the block
+        def gen():
+            with sd.InputStream(samplerate=rate, channels=1, dtype="float32", blocksize=per, callback=cb):
+                while not self._stop.is_set():
+                    try: yield q.get(timeout=0.5)
+                    except queue.Empty: continue
+        return gen(), rate
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -213,9 +1669,7 @@ class SettingsPanel(ctk.CTkFrame):
 
     def _build(self):
         c = self.c; fs = self.fs
-        lf = ctk.CTkFont("Space Mono", int(10*fs))
-        hf = ctk.CTkFont("Space Mono", int(11*fs), weight="bold")
-        bf = ctk.CTkFont("Space Mono", int(10*fs), weight="bold")
+        lf = FONTS.get(10); hf = FONTS.get(11, "bold"); bf = FONTS.get(10, "bold")
         pad = int(20*fs)
         txt   = "#ffffff"
         txt_s = "#aaaaaa"
@@ -233,6 +1687,15 @@ class SettingsPanel(ctk.CTkFrame):
         if self.settings.get("audio_enabled", True): self.sw_audio.select()
         sep()
 
+        r5 = ctk.CTkFrame(self, fg_color="transparent"); r5.pack(fill="x", padx=pad, pady=4)
+        ctk.CTkLabel(r5, text=f"Tenths in Last {self.settings.get('tenths_sec') or TENTHS_SEC} s",
+                     font=lf, text_color=txt).pack(side="left")
+        self.sw_tenths = ctk.CTkSwitch(r5, text="", width=int(44*fs),
+            progress_color=c["blue"], button_color="#cccccc")
+        self.sw_tenths.pack(side="right")
+        if self.settings.get("tenths_sec"): self.sw_tenths.select()
+        sep()
+
         r1 = ctk.CTkFrame(self, fg_color="transparent"); r1.pack(fill="x", padx=pad, pady=4)
         ctk.CTkLabel(r1, text="Always on Top", font=lf, text_color=txt).pack(side="left")
         self.sw_top = ctk.CTkSwitch(r1, text="", width=int(44*fs),
@@ -260,14 +1723,14 @@ class SettingsPanel(ctk.CTkFrame):
         credit_row = ctk.CTkFrame(self, fg_color="transparent")
         credit_row.pack(pady=(4, pad))
         ctk.CTkLabel(credit_row, text=f"Developed by Damon Downing, 2026",
-            font=ctk.CTkFont("Space Mono", int(10*fs)), text_color="#ffffff").pack(side="left")
+            font=lf, text_color="#ffffff").pack(side="left")
         self._settings_ver_lbl = ctk.CTkLabel(credit_row,
             text=f"  v{VERSION}", cursor="arrow",
-            font=ctk.CTkFont("Space Mono", int(10*fs)), text_color="#888888")
+            font=lf, text_color="#888888")
         self._settings_ver_lbl.pack(side="left")
         self._settings_update_lbl = ctk.CTkLabel(credit_row,
             text="", cursor="hand2",
-            font=ctk.CTkFont("Space Mono", int(10*fs)), text_color="#a8e063")
+            font=lf, text_color="#a8e063")
         self._settings_update_lbl.pack(side="left")
         self._settings_update_lbl.bind("<Button-1>", lambda e: webbrowser.open(RELEASES_URL))
 
@@ -275,14 +1738,13 @@ class SettingsPanel(ctk.CTkFrame):
         self.settings["always_on_top"] = bool(self.sw_top.get())
         self.settings["theme"]         = self.theme_var.get()
         self.settings["audio_enabled"] = bool(self.sw_audio.get())
+        self.settings["tenths_sec"]    = (self.settings.get("tenths_sec") or TENTHS_SEC) if self.sw_tenths.get() else 0
         self.on_apply(self.settings)
 
 # ─────────────────────────────────────────────────────────────────────────────
 # TimerZone
 # ─────────────────────────────────────────────────────────────────────────────
 class TimerZone(ctk.CTkFrame):
-    THRESH_YELLOW = 0.75
-    THRESH_RED    = 0.90
 
     def __init__(self, parent, label, fs, is_top, colors,
                  on_start=None, on_stop=None, on_next=None, **kw):
@@ -292,20 +1754,25 @@ class TimerZone(ctk.CTkFrame):
         self.on_pause = None
         self.on_spk_pause = None
         self.on_edit = None
+        self.on_commit = None                  # called after an inline edit sets a new duration
         self.total_sec = 0; self.remain_sec = 0; self.running = False; self.editable = True
         self.edit_min = 0; self.edit_sec = 0; self.stage = "great"
-        self._bar_pct = 0.0; self._pulse_alpha = 1.0
+        self._bar_pct = 0.0; self._pulse_i = PULSE_STEPS
+        self.tenths_on = False                 # seconds label owned by show_tenths()
+        self._view = _ViewState()
+        self._roles = {}                       # button -> BUTTON_STYLES role, for recolor()
         self._build()
 
     def _build(self):
         c = self.c; fs = self.fs
         self.configure(fg_color=c["zone_bg"], border_color=c["zone_border"], border_width=1, corner_radius=10)
-        ds  = int(88*fs) if self.is_top else int(62*fs)
-        lbs = int(10*fs); bts = int(11*fs); sts = int(10*fs)
-        BTN_W = int(140*fs)
+        f = {"label":  FONTS.get(10),
+             "digits": FONTS.get(88 if self.is_top else 62, "bold"),
+             "button": FONTS.get(11, "bold"),
+             "save":   FONTS.get(9, "bold")}
 
         self.lbl_zone = ctk.CTkLabel(self, text=self.label_text,
-            font=ctk.CTkFont("Space Mono", lbs), text_color=c["text_sub"])
+            font=f["label"], text_color=c["text_sub"])
         self.lbl_zone.pack(pady=(6,2))
 
         self._digit_outer = ctk.CTkFrame(self, fg_color="transparent")
@@ -315,49 +1782,43 @@ class TimerZone(ctk.CTkFrame):
         self._df_labels.pack()
 
         self.lbl_min = ctk.CTkLabel(self._df_labels, text="00",
-            font=ctk.CTkFont("Space Mono", ds, weight="bold"), text_color=c["edit_color"])
+            font=f["digits"], text_color=c["edit_color"])
         self.lbl_min.grid(row=0, column=0)
         self.lbl_col = ctk.CTkLabel(self._df_labels, text=":",
-            font=ctk.CTkFont("Space Mono", ds, weight="bold"), text_color=c["text_sub"])
+            font=f["digits"], text_color=c["text_sub"])
         self.lbl_col.grid(row=0, column=1, padx=2)
         self.lbl_sec_d = ctk.CTkLabel(self._df_labels, text="00",
-            font=ctk.CTkFont("Space Mono", ds, weight="bold"), text_color=c["edit_color"])
+            font=f["digits"], text_color=c["edit_color"])
         self.lbl_sec_d.grid(row=0, column=2)
+        v = self._view
+        v.seed(self, fg_color=c["zone_bg"])
+        v.seed(self.lbl_zone, text=self.label_text, text_color=c["text_sub"])
+        v.seed(self.lbl_min, text="00", text_color=c["edit_color"])
+        v.seed(self.lbl_col, text_color=c["text_sub"])
+        v.seed(self.lbl_sec_d, text="00", text_color=c["edit_color"])
         if self.is_top:
-            pencil_size = max(36, int(44 * fs))
-            self._pencil_bg = c["zone_bg"]
-            self._pencil_size = pencil_size
-            self._btn_edit = _make_pencil_canvas(
-                self._df_labels, pencil_size, c["zone_bg"], self._enter_edit_mode)
+            self._btn_edit = _PencilButton(
+                self._df_labels, self._pencil_size(), c["zone_bg"], self._enter_edit_mode)
             self._btn_edit.grid(row=0, column=3, padx=(12, 0))
         else:
             self._btn_edit = None
 
         self._df_entries = ctk.CTkFrame(self._digit_outer, fg_color="transparent")
 
-        self._ent_min = ctk.CTkEntry(self._df_entries,
-            width=int(120*fs) if self.is_top else int(90*fs),
-            height=int(70*fs) if self.is_top else int(60*fs), justify="center",
-            font=ctk.CTkFont("Space Mono", ds, weight="bold"),
-            fg_color=c["bg"], text_color=c["edit_color"],
+        self._ent_min = ctk.CTkEntry(self._df_entries, justify="center",
+            font=f["digits"], fg_color=c["bg"], text_color=c["edit_color"],
             border_color=c["edit_color"], border_width=2)
         self._ent_min.grid(row=0, column=0)
-        ctk.CTkLabel(self._df_entries, text=":",
-            font=ctk.CTkFont("Space Mono", ds, weight="bold"),
-            text_color=c["text_sub"]).grid(row=0, column=1, padx=4)
-        self._ent_sec = ctk.CTkEntry(self._df_entries,
-            width=int(120*fs) if self.is_top else int(90*fs),
-            height=int(70*fs) if self.is_top else int(60*fs), justify="center",
-            font=ctk.CTkFont("Space Mono", ds, weight="bold"),
-            fg_color=c["bg"], text_color=c["edit_color"],
+        self._ent_colon = ctk.CTkLabel(self._df_entries, text=":",
+            font=f["digits"], text_color=c["text_sub"])
+        self._ent_colon.grid(row=0, column=1, padx=4)
+        self._ent_sec = ctk.CTkEntry(self._df_entries, justify="center",
+            font=f["digits"], fg_color=c["bg"], text_color=c["edit_color"],
             border_color=c["edit_color"], border_width=2)
         self._ent_sec.grid(row=0, column=2)
         if self.is_top:
             self._btn_confirm = ctk.CTkButton(self._df_entries, text="SAVE",
-                width=int(62*fs), height=int(26*fs),
-                font=ctk.CTkFont("Space Mono", int(9*fs), weight="bold"),
-                fg_color="#27a85e", hover_color="#1e8449",
-                text_color="#ffffff", corner_radius=4,
+                font=f["save"], corner_radius=4, **button_colors(c, "save"),
                 command=self._commit_edit)
             self._btn_confirm.grid(row=0, column=3, padx=(10,0))
 
@@ -368,42 +1829,62 @@ class TimerZone(ctk.CTkFrame):
         self._ent_min.bind("<Tab>",    lambda e: (self._ent_sec.focus(), "break"))
         self._editing = False
 
-        bh = int(12*fs)
-        self.bar_cv = tk.Canvas(self, height=bh+int(16*fs), bg=c["zone_bg"], highlightthickness=0)
-        self.bar_cv.pack(fill="x", padx=int(28*fs), pady=(6,2))
-        self.bar_cv.bind("<Configure>", lambda e: self._draw_bar())
+        self.bar_cv = tk.Canvas(self, bg=c["zone_bg"], highlightthickness=0)
+        self.bar_cv.pack(fill="x", pady=(6,2))
+        self._bar = _BarRenderer(self.bar_cv, fs)
+        self.bar_cv.bind("<Configure>", self._on_bar_configure)
 
         self.lbl_status = ctk.CTkLabel(self, text="" if not self.is_top else "DOING GREAT",
-            font=ctk.CTkFont("Space Mono", sts), text_color=c["green"])
+            font=f["label"], text_color=c["green"])
         self.lbl_status.pack(pady=(0,2))
+        v.seed(self.lbl_status, text="" if not self.is_top else "DOING GREAT", text_color=c["green"])
 
         bf = ctk.CTkFrame(self, fg_color="transparent"); bf.pack(pady=(2,8))
         if self.is_top:
-            self.btn_s = ctk.CTkButton(bf, text="▶  START",
-                font=ctk.CTkFont("Space Mono",bts,weight="bold"),
-                fg_color=c["btn_start_bg"], text_color=c["btn_start_fg"],
-                width=BTN_W, height=int(34*fs), corner_radius=6,
+            self.btn_s = ctk.CTkButton(bf, text="▶  START", font=f["button"],
+                corner_radius=6, **button_colors(c, "start"),
                 command=lambda: self.on_start and self.on_start())
             self.btn_s.grid(row=0,column=0,padx=6)
-            self.btn_p = ctk.CTkButton(bf, text="■  STOP",
-                font=ctk.CTkFont("Space Mono",bts,weight="bold"),
-                fg_color="#2a1a1a", hover_color="#2a1a1a", text_color="#553333",
-                width=BTN_W, height=int(34*fs), corner_radius=6,
+            self.btn_p = ctk.CTkButton(bf, text="■  STOP", font=f["button"],
+                corner_radius=6, **button_colors(c, "stop_off"),
                 command=lambda: None)
             self.btn_p.grid(row=0,column=1,padx=6)
+            self._buttons = (self.btn_s, self.btn_p)
+            self._roles.update({self.btn_s: "start", self.btn_p: "stop_off", self._btn_confirm: "save"})
         else:
-            self.btn_spk_pause = ctk.CTkButton(bf, text="⏸  PAUSE",
-                font=ctk.CTkFont("Space Mono",bts,weight="bold"),
-                fg_color="#2a1a00", hover_color="#2a1a00", text_color="#3a2a00",
-                width=BTN_W, height=int(34*fs), corner_radius=6,
+            self.btn_spk_pause = ctk.CTkButton(bf, text="⏸  PAUSE", font=f["button"],
+                corner_radius=6, **button_colors(c, "spk_off"),
                 command=lambda: None)
             self.btn_spk_pause.grid(row=0, column=0, padx=6)
-            self.btn_n = ctk.CTkButton(bf, text="↺  NEXT / RESET",
-                font=ctk.CTkFont("Space Mono",bts,weight="bold"),
-                fg_color="#1a2030", hover_color="#1a2030", text_color="#2a3a50",
-                width=BTN_W, height=int(34*fs), corner_radius=6,
+            self.btn_n = ctk.CTkButton(bf, text="↺  NEXT / RESET", font=f["button"],
+                corner_radius=6, **button_colors(c, "next_off"),
                 command=lambda: None)
             self.btn_n.grid(row=0,column=1,padx=6)
+            self._buttons = (self.btn_spk_pause, self.btn_n)
+            self._roles.update({self.btn_spk_pause: "spk_off", self.btn_n: "next_off"})
+        self._apply_scale()
+
+    def _pencil_size(self):
+        return max(36, int(44 * self.fs))
+
+    def _apply_scale(self):
+        """Set every zoom-dependent widget size and padding from self.fs (fonts scale via FONTS)."""
+        fs = self.fs
+        for ent in (self._ent_min, self._ent_sec):
+            ent.configure(width=int(120*fs) if self.is_top else int(90*fs),
+                          height=int(70*fs) if self.is_top else int(60*fs))
+        if self.is_top:
+            self._btn_edit.resize(self._pencil_size())
+            self._btn_confirm.configure(width=int(62*fs), height=int(26*fs))
+        self.bar_cv.configure(height=int(12*fs)+int(16*fs))
+        self.bar_cv.pack_configure(padx=int(28*fs))
+        for btn in self._buttons: btn.configure(width=int(140*fs), height=int(34*fs))
+
+    def rescale(self, fs):
+        """Resize this zone in place for a new zoom factor; widgets, state and callbacks are kept."""
+        if fs == self.fs: return
+        self.fs = fs; self._apply_scale()
+        self._bar.set_scale(fs); self._draw_bar()
 
     def _enter_edit_mode(self):
         if not self.editable or self._editing: return
@@ -423,8 +1904,7 @@ class TimerZone(ctk.CTkFrame):
             self._ent_min.select_range(0, "end")
         except: pass
         if self.is_top:
-            self.btn_s.configure(fg_color="#1a2e1a", hover_color="#1a2e1a",
-                               text_color="#2a4a2a", cursor="arrow")
+            self.set_button(self.btn_s, "start_off", cursor="arrow")
 
     def _commit_edit(self):
         if not self._editing: return
@@ -438,9 +1918,8 @@ class TimerZone(ctk.CTkFrame):
         self._cancel_edit()
         self.set_time(m, s)
         if self.is_top:
-            self.btn_s.configure(fg_color=self.c["btn_start_bg"],
-                               hover_color="#27a85e",
-                               text_color=self.c["btn_start_fg"], cursor="hand2")
+            self.set_button(self.btn_s, "start", cursor="hand2")
+        if self.on_commit: self.on_commit()
 
     def _cancel_edit(self):
         if not self._editing: return
@@ -450,35 +1929,18 @@ class TimerZone(ctk.CTkFrame):
         self._ent_sec.configure(border_color=self.c["edit_color"])
         self._df_labels.pack()
         if self.is_top:
-            self.btn_s.configure(fg_color=self.c["btn_start_bg"],
-                               hover_color="#27a85e",
-                               text_color=self.c["btn_start_fg"], cursor="hand2")
+            self.set_button(self.btn_s, "start", cursor="hand2")
 
-    def _draw_bar(self, pulse_alpha=None):
-        c = self.c; cv = self.bar_cv; cv.delete("all")
-        W = cv.winfo_width()
-        if W < 4: return
-        fs = self.fs; bh = int(12*fs); y0 = int(8*fs); y1 = y0+bh; r = bh//2
-        stage = self.stage; pct = min(self._bar_pct, 1.0)
-        track_col = {"great":c["bar_track"],
-                     "yellow":_blend(c["yellow"],c["zone_bg"],0.85),
-                     "red":   _blend(c["red"],c["zone_bg"],0.85),
-                     "done":  _blend(c["red"],c["zone_bg"],0.80)}.get(stage,c["bar_track"])
-        _rrect(cv, 0, y0, W, y1, r, fill=track_col, outline="")
-        fill_col = {"great":c["green"],"yellow":c["yellow"],"red":c["red"],"done":c["red"]}.get(stage,c["green"])
-        fw = int(W*pct)
-        if fw > 2: _rrect(cv, 0, y0, fw, y1, r, fill=fill_col, outline="")
-        ex = int(5*fs); my0 = y0-ex; my1 = y1+ex
-        if stage == "great":
-            _vbar(cv, int(W*0.75), my0, my1, c["yellow"])
-            _vbar(cv, int(W*0.90), my0, my1, c["red"])
-        elif stage == "yellow":
-            _vbar(cv, int(W*0.90), my0, my1, c["red"])
-        elif stage == "red":
-            a = pulse_alpha if pulse_alpha is not None else self._pulse_alpha
-            col = _blend(c["red"], c["zone_bg"], 1.0 - a*0.9)
-            ex2 = int(7*fs)
-            cv.create_rectangle(W-5, y0-ex2, W, y1+ex2, fill=col, outline="")
+    def _on_bar_configure(self, event):
+        if self._bar.resize(event.width): self._draw_bar()
+
+    def _draw_bar(self):
+        c = self.c; stage = self.stage; ramps = get_ramps(c)
+        marks = ((c["yellow"], c["red"]) if stage == "great" else
+                 (None, c["red"])        if stage == "yellow" else (None, None))
+        pulse_col = ramps.marker[self._pulse_i] if stage == "red" else None
+        self._bar.draw(min(self._bar_pct, 1.0), ramps.track.get(stage, c["bar_track"]),
+                       ramps.fill.get(stage, c["green"]), marks, pulse_col)
 
     def set_time(self, m, s):
         self.edit_min = m; self.edit_sec = s
@@ -492,86 +1954,99 @@ class TimerZone(ctk.CTkFrame):
         self._refresh_digit_color()
         self._apply_stage()
         if self.is_top:
-            self.btn_s.configure(text="⏸  PAUSE",
-                fg_color="#e67e22", hover_color="#ca6f1e", text_color="#ffffff",
+            self.set_button(self.btn_s, "pause", text="⏸  PAUSE",
                 command=lambda: self.on_pause and self.on_pause())
-            self.btn_p.configure(fg_color=self.c["btn_stop_bg"], hover_color="#c0392b",
-                text_color=self.c["btn_stop_fg"], text="■  STOP / RESET",
+            self.set_button(self.btn_p, "stop", text="■  STOP / RESET",
                 command=lambda: self.on_stop and self.on_stop())
         else:
-            self.btn_spk_pause.configure(fg_color="#e67e22", hover_color="#ca6f1e",
-                text_color="#ffffff",
+            self.set_button(self.btn_spk_pause, "pause",
                 command=lambda: self.on_spk_pause and self.on_spk_pause())
-            self.btn_n.configure(fg_color=self.c["btn_next_bg"], hover_color="#2a7ac0",
-                text_color=self.c["btn_next_fg"],
+            self.set_button(self.btn_n, "next",
                 command=lambda: self.on_next and self.on_next())
 
     def stop_timer(self):
-        self.running = False; self.editable = True
+        self.running = False; self.editable = True; self.tenths_on = False
         if self._btn_edit: self._btn_edit.grid()
         self.stage = "great"; self._bar_pct = 0.0
-        self.configure(fg_color=self.c["zone_bg"])
-        self.lbl_zone.configure(text=self.label_text, text_color=self.c["text_sub"])
-        self.lbl_min.configure(text_color=self.c["edit_color"])
-        self.lbl_sec_d.configure(text_color=self.c["edit_color"])
-        self.lbl_col.configure(text_color=self.c["text_sub"])
-        self.lbl_status.configure(text="")
+        v = self._view
+        v.set(self, fg_color=self.c["zone_bg"])
+        v.set(self.lbl_zone, text=self.label_text, text_color=self.c["text_sub"])
+        v.set(self.lbl_min, text_color=self.c["edit_color"])
+        v.set(self.lbl_sec_d, text_color=self.c["edit_color"])
+        v.set(self.lbl_col, text_color=self.c["text_sub"])
+        v.set(self.lbl_status, text="")
         if self.is_top:
-            self.btn_s.configure(text="▶  START",
-                fg_color=self.c["btn_start_bg"], hover_color="#27a85e",
-                text_color=self.c["btn_start_fg"],
+            self.set_button(self.btn_s, "start", text="▶  START",
                 command=lambda: self.on_start and self.on_start())
-            self.btn_p.configure(text="■  STOP",
-                fg_color="#2a1a1a", hover_color="#2a1a1a",
-                text_color="#553333", command=lambda: None)
+            self.set_button(self.btn_p, "stop_off", text="■  STOP", command=lambda: None)
         else:
-            self.btn_spk_pause.configure(text="⏸  PAUSE",
-                fg_color="#2a1a00", hover_color="#2a1a00", text_color="#3a2a00",
-                command=lambda: None)
-            self.btn_n.configure(fg_color="#1a2030", hover_color="#1a2030",
-                text_color="#2a3a50", command=lambda: None)
+            self.set_button(self.btn_spk_pause, "spk_off", text="⏸  PAUSE", command=lambda: None)
+            self.set_button(self.btn_n, "next_off", command=lambda: None)
+
+    def set_button(self, btn, role, **kw):
+        """Colour one of this zone's buttons by BUTTON_STYLES role (kept for recolor()), plus any options."""
+        self._roles[btn] = role
+        btn.configure(**button_colors(self.c, role), **kw)
+
+    def recolor(self, c):
+        """Switch to palette c in place: fixed colours directly, state colours by re-applying the state."""
+        if c is self.c: return
+        self.c = c
+        self.configure(border_color=c["zone_border"])
+        for ent in (self._ent_min, self._ent_sec):
+            ent.configure(fg_color=c["bg"], text_color=c["edit_color"], border_color=c["edit_color"])
+        self._ent_colon.configure(text_color=c["text_sub"])
+        self.bar_cv.configure(bg=c["zone_bg"])
+        if self._btn_edit: self._btn_edit.configure(bg=c["zone_bg"])
+        for btn, role in self._roles.items(): btn.configure(**button_colors(c, role))
+        if self.running: self._apply_stage()
+        else:
+            v = self._view
+            v.set(self, fg_color=c["zone_bg"]); v.set(self.lbl_status, text_color=c["green"])
+            v.set(self.lbl_zone, text_color=c["text_sub"]); v.set(self.lbl_col, text_color=c["text_sub"])
+        self._refresh_digit_color()
+        if self.stage == "done": self.pulse_tick(self._pulse_i)
+        self._draw_bar()
 
     def reset_speaker(self):
         self.remain_sec = self.total_sec; self.stage = "great"; self._bar_pct = 0.0
+        self.tenths_on = False
         self._refresh_display(); self._apply_stage(); self._draw_bar()
 
-    def tick(self):
-        if not self.running or self.remain_sec <= 0: return None
-        self.remain_sec -= 1; self._refresh_display()
-        return self._check_stage()
+    def show_tenths(self, tenths):
+        """Final-seconds display from the time left in whole tenths; touches only the digit labels."""
+        self.tenths_on = True; s = tenths // 10
+        self._view.set(self.lbl_min, text=f"{s//60:02d}")      # unchanged → no Tk call
+        self._view.set(self.lbl_sec_d, text=f"{s%60:02d}.{tenths%10}")
+
+    def hide_tenths(self):
+        if not self.tenths_on: return
+        self.tenths_on = False; self._refresh_display()
+
+    def tick(self, remain, stage=None):
+        """Show the engine's remaining seconds and switch to `stage` (from tick_decision) if given."""
+        if not self.running or remain == self.remain_sec: return
+        self.remain_sec = remain; self._refresh_display()
+        if stage: self.stage = stage; self._apply_stage()
 
     def _refresh_display(self):
         m = self.remain_sec//60; s = self.remain_sec%60
-        self.lbl_min.configure(text=f"{m:02d}"); self.lbl_sec_d.configure(text=f"{s:02d}")
+        if not self.tenths_on:
+            self._view.set(self.lbl_min, text=f"{m:02d}"); self._view.set(self.lbl_sec_d, text=f"{s:02d}")
         self._bar_pct = 1.0-(self.remain_sec/self.total_sec) if self.total_sec>0 else 0.0
         self._draw_bar()
         if self.is_top and self.stage == "great":
             self._apply_stage()
 
-    def _check_stage(self):
-        pct = self._bar_pct
-        new = ("done" if self.remain_sec==0 else
-               "red"  if pct>=self.THRESH_RED else
-               "yellow" if pct>=self.THRESH_YELLOW else "great")
-        if new != self.stage:
-            self.stage = new; self._apply_stage(); return new
-        return None
-
     def _apply_stage(self):
         c = self.c; s = self.stage; pct = self._bar_pct
         if self.is_top:
-            if s in ("done","red"): self.configure(fg_color=c["bg_red"])
-            elif s == "yellow":     self.configure(fg_color=c["bg_yellow"])
-            else:                   self.configure(fg_color=c["zone_bg"])
             if s == "done":              status_text, status_color = "TIME'S UP", c["red"]
             elif s == "red":             status_text, status_color = "FINALIZE THE EPISODE", c["red"]
             elif s == "yellow":          status_text, status_color = "START SUMMARIZING", c["yellow"]
             elif 0.50 <= pct < 0.55:     status_text, status_color = "HALF WAY THERE", c["green"]
             else:                        status_text, status_color = "", c["green"]
         else:
-            if s in ("done","red"): self.configure(fg_color=c["bg_red"])
-            elif s == "yellow":     self.configure(fg_color=c["bg_yellow"])
-            else:                   self.configure(fg_color=c["zone_bg"])
             status_color, status_text = {"great":(c["green"],"DOING GREAT"),
                  "yellow":(c["yellow"],"GET TO THE POINT"),
                  "red":   (c["red"],"WRAP IT UP"),
@@ -584,87 +2059,354 @@ class TimerZone(ctk.CTkFrame):
             zone_color, zone_text = c["text_sub"], self.label_text
             digit_color = c["text"]; colon_color = c["text_sub"]
 
-        self.lbl_status.configure(text=status_text, text_color=status_color)
-        self.lbl_zone.configure(text=zone_text, text_color=zone_color)
-        self.lbl_min.configure(text_color=digit_color)
-        self.lbl_sec_d.configure(text_color=digit_color)
-        self.lbl_col.configure(text_color=colon_color)
+        v = self._view
+        v.set(self, fg_color=c["bg_red"] if s in ("done","red") else
+                             c["bg_yellow"] if s == "yellow" else c["zone_bg"])
+        v.set(self.lbl_status, text=status_text, text_color=status_color)
+        v.set(self.lbl_zone, text=zone_text, text_color=zone_color)
+        v.set(self.lbl_min, text_color=digit_color)
+        v.set(self.lbl_sec_d, text_color=digit_color)
+        v.set(self.lbl_col, text_color=colon_color)
+
+    @property
+    def status_text(self):
+        return self._view.get(self.lbl_status, "text", "")
+
+    @property
+    def tk_calls(self):
+        """Running total of Tk calls made by the diffed display paths (labels, frame, bar)."""
+        return self._view.calls + self._bar.calls
 
     def _refresh_digit_color(self):
         c = self.c
         col = c["edit_color"] if self.editable else (c["red"] if self.stage=="done" else c["text"])
-        self.lbl_min.configure(text_color=col); self.lbl_sec_d.configure(text_color=col)
+        self._view.set(self.lbl_min, text_color=col); self._view.set(self.lbl_sec_d, text_color=col)
 
-    def pulse_tick(self, alpha):
-        self._pulse_alpha = alpha
-        if self.stage == "red": self._draw_bar(pulse_alpha=alpha)
-        if self.stage == "done":
-            pulse_color = _blend(self.c["red"], "#ffffff", alpha)
-            self.lbl_min.configure(text_color=pulse_color)
-            self.lbl_sec_d.configure(text_color=pulse_color)
-            self.lbl_col.configure(text_color=pulse_color)
+    def pulse_tick(self, step):
+        """Advance the red/done animation to pulse step 0..PULSE_STEPS."""
+        self._pulse_i = step
+        if self.stage == "red": self._draw_bar()
+        elif self.stage == "done":
+            ramps = get_ramps(self.c); pulse_color = ramps.digit[step]
+            v = self._view
+            v.set(self.lbl_min, text_color=pulse_color)
+            v.set(self.lbl_sec_d, text_color=pulse_color)
+            v.set(self.lbl_col, text_color=pulse_color)
+            v.set(self, fg_color=ramps.zone_bg[step])
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # PodcastTimerApp
 # ─────────────────────────────────────────────────────────────────────────────
 class PodcastTimerApp(ctk.CTk):
-    def __init__(self):
+    def __init__(self, startup_times=False, perf_overlay=False, control_port=None, osc_port=None,
+                 sync_lead=None, sync_follow=None, vad=None):
         super().__init__()
+        self._startup_times = startup_times
+        self._sys_dark = True              # assumed until _background_init() has asked the OS
+        self._theme_watch = _OsThemeWatch(lambda dark: self._post(self._on_os_theme, dark))
         self.settings = load_settings()
-        self._pulse_val = 0.0; self._pulse_dir = 1
+        self._pulse_i = 0; self._pulse_dir = 1; self._pulse_stride = 1
         self._settings_open = False; self._clock_running = False
         self._colon_visible = True
         self._spk_paused = False
-        self._resize_job = None
+        self.tick_tk_calls = 0             # Tk calls made by the display during the last _tick
         self._last_fs = 1.0
         self._available_version = None   # set when update check finds something
+        self.sync_leader = SyncLeader(sync_lead) if sync_lead else None
+        self.sync_follower = (SyncFollower(sync_follow, lambda st: self._post(self._on_sync_state, st))
+                              if sync_follow else None)
+        # A follower's engine runs on the leader's timeline so leader snapshots restore as-is
+        self.engine = TimerEngine(self.sync_follower.clock) if self.sync_follower else TimerEngine()
+        self.journal = SessionJournal(JOURNAL_FILE); self._last_snap = 0.0
+        self.perf = PerfStats()
+        self.sched = Scheduler(self, self.perf)
+        self._perf_label = None
+        self._inbox = queue.SimpleQueue()  # callables posted by worker threads
+        self._inbox_lock = threading.Lock(); self._inbox_armed = False   # a wake-up byte is pending
+        # Workers never call Tk: _post() writes a byte that Tk's file handler notices.
+        # Windows Tk has no file handlers, so there a Tk-thread poll that backs off when idle.
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._wake_r.setblocking(False); self._wake_w.setblocking(False)
+        self._inbox_fh = False
+        if sys.platform != "win32":
+            try:
+                self.tk.createfilehandler(self._wake_r, tk.READABLE, self._on_inbox_wake)
+                self._inbox_fh = True
+            except Exception: pass
+        self._inbox_poll_ms = INBOX_POLL_MS[0]
+        if not self._inbox_fh: self.sched.every("inbox_poll", INBOX_POLL_MS[0], self._poll_inbox)
+        self.vad = (VoiceActivity(lambda active: self._post(self._vad_sync), vad,
+                                  self.settings.get("vad_threshold_db", -40)) if vad else None)
+        port = self.settings.get("control_port", 0) if control_port is None else control_port
+        self.control = ControlServer(self._post, self._remote_command, port=port) if port else None
+        self._bg_started = False
+        self._hidden = False
+        self.bind("<Map>", self._on_map)
+        self.bind("<Unmap>", self._on_unmap)
+        self.bind("<Control-Shift-P>", lambda e: self._toggle_perf_overlay())
+        # Fallback in case the window starts minimized and never maps
+        self.sched.once("first_paint", 3000, self._on_first_paint)
         self._apply_settings(self.settings, first_run=True)
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+        self.osc = None
+        port = self.settings.get("osc_port", 0) if osc_port is None else osc_port
+        if port:
+            try: self.osc = OscListener(self, self._post, self._remote_command, port,
+                                        targets=self.settings.get("osc_targets", []), perf=self.perf)
+            except OSError as e: print(f"OSC: cannot listen on UDP port {port}: {e}", file=sys.stderr)
+        self.sched.once("recover", 300, self._offer_recovery)
         # Kick off update check after UI is up
-        self.after(2000, self._start_update_check)
+        self.sched.once("update_check", 2000, self._start_update_check)
+        if perf_overlay: self._toggle_perf_overlay()
+
+    def _on_close(self):
+        self.journal.discard()        # a deliberate quit ends the session; only crashes leave a journal
+        self.destroy()
+
+    def _journal(self, ev, **data):
+        self.journal.record(ev, self.engine.clock(), **data)
+
+    def _journal_snapshot(self):
+        self._last_snap = now = self.engine.clock()
+        self.journal.snapshot(now, self.engine.snapshot())
+
+    def _offer_recovery(self):
+        found = SessionJournal.recover(JOURNAL_FILE)
+        if not found: return
+        snap, when = found
+        top_left = max(0, snap["top_total"] - int(snap["top_el"]))
+        bot_left = max(0, snap["bot_total"] - int(snap["bot_el"]))
+        msg = (f"A session was interrupted at {time.strftime('%H:%M', time.localtime(when))}.\n\n"
+               f"Episode Timer:  {top_left//60:02d}:{top_left%60:02d} left\n"
+               f"Speaker Timer:  {bot_left//60:02d}:{bot_left%60:02d} left\n\n"
+               "Resume it? (It will be restored paused.)")
+        if messagebox.askyesno("Resume session?", msg, parent=self): self._restore_session(snap)
+        else: self.journal.discard()
+
+    def _restore_session(self, snap):
+        """Put both zones back to a journaled state, paused, without replaying audio cues."""
+        tt, bt = int(snap["top_total"]), int(snap["bot_total"])
+        self.top_zone.set_time(tt // 60, tt % 60); self.bot_zone.set_time(bt // 60, bt % 60)
+        self._on_start()
+        self.engine.restore(dict(snap, running=True, spk_paused=False))
+        self._advance_zones()
+        self._journal_snapshot()
+        self._on_pause()
+
+    def _remote_command(self, name):
+        """Run a control command on the Tk thread; commands the current state doesn't allow are ignored."""
+        active = self.top_zone.running; running = self._clock_running
+        if name == "start" and not active:                    self._on_start()
+        elif name == "pause" and running:                     self._on_pause()
+        elif name == "resume" and active and not running:     self._on_resume()
+        elif name == "next" and running:
+            (self._on_next_while_paused if self._spk_paused else self._on_next)()
+        elif name == "reset" and active:                      self._on_reset()
+        elif name == "spk_pause" and running and not self._spk_paused: self._on_spk_pause()
+        elif name == "spk_resume" and running and self._spk_paused:    self._on_spk_resume()
+
+    def _state(self):
+        """Plain-dict view of both timers for remote clients."""
+        zone = lambda z: {"remain": z.remain_sec, "total": z.total_sec, "stage": z.stage,
+                          "status": z.status_text}
+        status = (("speaker paused" if self._spk_paused else "running") if self._clock_running else
+                  "paused" if self.top_zone.running else "ready")
+        return {"status": status, "top": zone(self.top_zone), "bot": zone(self.bot_zone)}
+
+    def _vad_sync(self):
+        """--vad: run the speaker clock only while someone is talking (Tk thread)."""
+        if self.vad is None or not self._clock_running: return
+        if self.vad.active and self._spk_paused:       self._on_spk_resume()
+        elif not self.vad.active and not self._spk_paused: self._on_spk_pause()
+
+    def _publish_state(self):
+        if self.control is not None: self.control.publish(self._state())
+        if self.sync_leader is not None:
+            now = self.engine.clock()
+            # totals: the zones' configured durations (the engine's are stale until the next START)
+            self.sync_leader.publish({"status": self._state()["status"],
+                                      "totals": [self.top_zone.total_sec, self.bot_zone.total_sec],
+                                      "snap": self.engine.snapshot(now), "at": now})
+
+    def _on_sync_state(self, st):
+        """Follower: mirror the leader's session (posted from the sync thread)."""
+        snap = st["snap"]; tt, bt = int(snap["top_total"]), int(snap["bot_total"])
+        if st.get("status") == "ready":
+            if self.top_zone.running: self._on_reset()
+            durations = sync_durations(st)
+            if durations and (self.top_zone.total_sec, self.bot_zone.total_sec) != durations:
+                tt, bt = durations
+                self.top_zone.set_time(tt // 60, tt % 60); self.bot_zone.set_time(bt // 60, bt % 60)
+            return
+        drift = self.engine.drift(snap, st["at"])
+        if self.top_zone.running and drift is not None and drift * 1000 < SYNC_SLEW_MS: return
+        if not self.top_zone.running or (self.top_zone.total_sec, self.bot_zone.total_sec) != (tt, bt):
+            if self.top_zone.running: self._on_reset()
+            self.top_zone.set_time(tt // 60, tt % 60); self.bot_zone.set_time(bt // 60, bt % 60)
+            self._on_start()
+        # Bring the buttons into line with the leader, then take its exact timings
+        if snap["running"] != self._clock_running: (self._on_resume if snap["running"] else self._on_pause)()
+        if snap["running"] and snap["spk_paused"] != self._spk_paused:
+            (self._on_spk_pause if snap["spk_paused"] else self._on_spk_resume)()
+        self.engine.restore(snap, at=st["at"])
+        if self._clock_running:
+            self._tick(); self.sched.cancel("clock")
+            self.sched.every("clock", 1000, self._tick, first_ms=self._next_tick_ms())
+        else:
+            self._advance_zones(); self._publish_state()
+
+    def _post(self, fn, *args):
+        """Thread-safe: queue fn(*args) to run on the Tk thread; never calls Tk itself."""
+        self._inbox.put((fn, args))
+        if not self._inbox_fh: return      # picked up by _poll_inbox
+        with self._inbox_lock:
+            if self._inbox_armed: return
+            self._inbox_armed = True
+        try: self._wake_w.send(b"\0")
+        except OSError: pass
+
+    def _on_inbox_wake(self, *_):
+        with self._inbox_lock: self._inbox_armed = False   # later posts write a fresh byte
+        try:
+            while self._wake_r.recv(64): pass
+        except OSError: pass                # BlockingIOError: all read
+        self._drain_inbox()
+
+    def _poll_inbox(self):
+        """Windows: drain, polling faster while messages arrive and backing off when idle."""
+        lo, hi = INBOX_POLL_MS
+        self._inbox_poll_ms = lo if self._drain_inbox() else min(hi, self._inbox_poll_ms * 2)
+        return self._inbox_poll_ms
+
+    def _drain_inbox(self):
+        """Run everything posted so far; returns how many callables ran."""
+        t = time.perf_counter(); n = 0
+        while True:
+            try: fn, args = self._inbox.get_nowait()
+            except queue.Empty: break
+            n += 1
+            try: fn(*args)
+            except Exception: self.report_callback_exception(*sys.exc_info())
+        if n: self.perf.record("inbox", (time.perf_counter()-t)*1000)
+        return n
 
     def _apply_settings(self, s, first_run=False):
-        self.settings = s; save_settings(s)
+        """Save s and apply what changed; only the first run builds the widget tree."""
+        old = self.settings; self.settings = s; save_settings(s)
+        if not first_run:
+            # Audio, tenths and the like are read where they're used; only looks touch widgets
+            changed = {k for k in s.keys() | old.keys() if s.get(k) != old.get(k)}
+            if self._settings_open: self._close_settings()
+            if "always_on_top" in changed: self.attributes("-topmost", s["always_on_top"])
+            if "theme" in changed: self._set_theme(); self._follow_os_theme()
+            return
         theme = s["theme"]
-        try:
-            import darkdetect; sys_dark = darkdetect.isDark()
-        except Exception: sys_dark = True
-        self.c = get_palette(theme, sys_dark)
+        self.c = get_palette(theme, self._sys_dark); SHAPES.set_palette(self.c)
         ctk.set_appearance_mode("dark" if theme in ("dark","system") else "light")
-        if first_run:
-            self.title("Podcast Timer")
-            self.resizable(True, True)
-            self.minsize(MIN_WIDTH, int(MIN_WIDTH * 565 / 560))
-            self.maxsize(MAX_WIDTH, int(MAX_WIDTH * 565 / 560 + 200))
+        self.title("Podcast Timer")
+        self.resizable(True, True)
+        self.minsize(MIN_WIDTH, int(MIN_WIDTH * 565 / 560))
+        self.maxsize(MAX_WIDTH, int(MAX_WIDTH * 565 / 560 + 200))
+        # Size the window before building so the first build is already at the
+        # launch scale; the window isn't realized yet, so _get_fs() can't be used.
+        self._size_window(INITIAL_FS)
         self.attributes("-topmost", s["always_on_top"])
-        for w in self.winfo_children(): w.destroy()
-        self._settings_open = False
-        fs = self._get_fs()
-        self._build_ui(fs)
+        t = time.perf_counter()
+        self._build_ui(INITIAL_FS)
+        STARTUP.mark("build_ui", t); self._built_at = time.perf_counter()
         self.top_zone.set_time(s["top_minutes"], s["top_seconds"])
         self.bot_zone.set_time(s["bot_minutes"], s["bot_seconds"])
-        if first_run:
-            self._size_window(1.4)
-            self.after(50, self._initial_build)
-            self.bind("<Configure>", self._on_window_resize)
+        self.bind("<Configure>", self._on_window_resize)
 
-    def _initial_build(self):
-        """Rebuild UI after window is fully realized so _get_fs() reads the correct width."""
-        fs = self._get_fs()
-        top_min = self.settings["top_minutes"]; top_sec = self.settings["top_seconds"]
-        bot_min = self.settings["bot_minutes"]; bot_sec = self.settings["bot_seconds"]
-        for w in self.winfo_children(): w.destroy()
-        self._settings_open = False
-        self._build_ui(fs)
-        self.top_zone.set_time(top_min, top_sec)
-        self.bot_zone.set_time(bot_min, bot_sec)
-        self._last_fs = fs
-        # Re-show banner if an update was already found before resize
-        if self._available_version:
-            self._show_update_banner(self._available_version)
+    def _set_theme(self):
+        """Pick the palette for the current theme setting and OS mode; recolour in place if it differs."""
+        theme = self.settings["theme"]
+        ctk.set_appearance_mode("dark" if theme in ("dark","system") else "light")
+        c = get_palette(theme, self._sys_dark)
+        if c is not self.c:
+            SHAPES.set_palette(c); self._recolor(c)
+
+    def _recolor(self, c):
+        """Restyle the existing window for palette c; zones keep their state, timers keep running."""
+        self.c = c
+        self.configure(fg_color=c["bg"])
+        self._title_bar.configure(fg_color=c["title_bg"])
+        self._title_lbl.configure(text_color=c["text_sub"])
+        self.btn_settings.configure(hover_color=c["bar_track"], text_color=c["text_sub"])
+        self._zone_sep.configure(fg_color=c["bar_track"])
+        self.top_zone.recolor(c); self.bot_zone.recolor(c)
+        self._update_bg(self.top_zone.stage)
+        if self._settings_open:            # transient popup — reopen in the new colours
+            self._close_settings(); self._open_settings()
+
+    def _on_map(self, event):
+        if event.widget is not self: return
+        self._hidden = False; self._update_pulse()
+        # Idle callbacks run after Tk has drawn the newly mapped window
+        if not self._bg_started: self.after_idle(self._on_first_paint)
+
+    def _on_unmap(self, event):
+        if event.widget is not self: return
+        self._hidden = True; self._update_pulse()
+
+    def _toggle_perf_overlay(self):
+        """Ctrl+Shift+P / --perf-overlay: show or hide the scheduler timing overlay."""
+        if self.sched.cancel("perf_overlay") or self._perf_label is not None:
+            try: self._perf_label.destroy()
+            except Exception: pass
+            self._perf_label = None; return
+        self.sched.every("perf_overlay", 500, self._refresh_perf_overlay, first_ms=0)
+
+    def _refresh_perf_overlay(self):
+        lbl = self._perf_label
+        if lbl is None or not lbl.winfo_exists():       # first show, or wiped by a rebuild
+            lbl = self._perf_label = tk.Label(self, font=("Courier", 8), justify="left",
+                                              anchor="nw", bg="#000000", fg="#7cfc00")
+            lbl.place(x=4, rely=1.0, y=-4, anchor="sw")
+        lbl.configure(text=self.perf.report() + "\n" + AUDIO.report()); lbl.lift()
+
+    def _on_first_paint(self):
+        if self._bg_started: return
+        self._bg_started = True; self.sched.cancel("first_paint")
+        STARTUP.mark("first_paint", self._built_at)   # from the end of build_ui
+        STARTUP.mark("to_first_paint", _T0)            # total since process start
+        self._drain_inbox()                # anything posted before the main loop was running
+        threading.Thread(target=self._background_init, daemon=True).start()
+
+    def _background_init(self):
+        """Worker thread: start audio and ask the OS for its theme after first paint."""
+        if init_audio(): TONES.warm(); AUDIO.start()
+        if self.vad is not None: self.vad.start()
+        if self.control is not None and not self.control.start():
+            print(f"Control server: cannot listen on port {self.control.port}: {self.control.error}",
+                  file=sys.stderr)
+        t = time.perf_counter()
+        try:
+            import darkdetect; sys_dark = bool(darkdetect.isDark())
+        except Exception: sys_dark = True
+        STARTUP.mark("theme_detect", t)
+        self._post(self._on_background_ready, sys_dark)
+
+    def _on_background_ready(self, sys_dark):
+        self._on_os_theme(sys_dark); self._follow_os_theme()
+        self._publish_state()
+        if self._startup_times:
+            print("Startup times:\n" + STARTUP.report(), flush=True)
+
+    def _follow_os_theme(self):
+        """Watch the OS light/dark mode only while the theme is System."""
+        if self.settings["theme"] == "system": self._theme_watch.start()
+        else: self._theme_watch.stop()
+
+    def _on_os_theme(self, sys_dark):
+        """OS light/dark reported (startup or the theme watcher); "system" theme recolours in place."""
+        if sys_dark == self._sys_dark: return
+        self._sys_dark = sys_dark
+        if self.settings["theme"] == "system": self._set_theme()
 
     def _start_update_check(self):
-        _check_for_update(lambda v: self.after(0, self._on_update_result, v))
+        _check_for_update(lambda v: self._post(self._on_update_result, v))
 
     def _on_update_result(self, new_version):
         if not new_version: return
@@ -700,9 +2442,7 @@ class PodcastTimerApp(ctk.CTk):
         if not hasattr(self, '_last_fs'): self._last_fs = 1.0
         if abs(new_fs - self._last_fs) < 0.02: return
         self._last_fs = new_fs
-        if hasattr(self, '_resize_job') and self._resize_job:
-            self.after_cancel(self._resize_job)
-        self._resize_job = self.after(120, self._do_resize)
+        self.sched.once("resize", 40, self._do_resize)
 
     def _size_window(self, fs):
         self.update_idletasks()
@@ -712,87 +2452,24 @@ class PodcastTimerApp(ctk.CTk):
         self._last_fs = fs  # pre-seed so resize events don't fire until user actually drags
 
     def _do_resize(self):
-        self._resize_job = None
-        # Capture full timer state before destroying widgets
-        top_min      = self.top_zone.edit_min
-        top_sec      = self.top_zone.edit_sec
-        top_remain   = self.top_zone.remain_sec
-        top_total    = self.top_zone.total_sec
-        top_stage    = self.top_zone.stage
-        top_bar_pct  = self.top_zone._bar_pct
-        top_running  = self.top_zone.running
-        bot_min      = self.bot_zone.edit_min
-        bot_sec      = self.bot_zone.edit_sec
-        bot_remain   = self.bot_zone.remain_sec
-        bot_total    = self.bot_zone.total_sec
-        bot_stage    = self.bot_zone.stage
-        bot_bar_pct  = self.bot_zone._bar_pct
-        bot_running  = self.bot_zone.running
-        was_running  = self._clock_running
-
+        """Rescale the existing widget tree in place for the current window width."""
         fs = self._get_fs()
-        for w in self.winfo_children(): w.destroy()
-        self._settings_open = False
-        self._build_ui(fs)
-
-        # Restore set-time (for edit fields) without touching remain_sec
-        self.top_zone.edit_min   = top_min;  self.top_zone.edit_sec  = top_sec
-        self.top_zone.total_sec  = top_total; self.top_zone.remain_sec = top_remain
-        self.top_zone.stage      = top_stage; self.top_zone._bar_pct  = top_bar_pct
-        self.bot_zone.edit_min   = bot_min;  self.bot_zone.edit_sec  = bot_sec
-        self.bot_zone.total_sec  = bot_total; self.bot_zone.remain_sec = bot_remain
-        self.bot_zone.stage      = bot_stage; self.bot_zone._bar_pct  = bot_bar_pct
-
-        # Refresh display with current remaining time
-        self.top_zone._refresh_display()
-        self.bot_zone._refresh_display()
-        self.top_zone._apply_stage()
-        self.bot_zone._apply_stage()
-
-        # Restore running UI state if timers were active
-        if top_running:
-            self.top_zone.running  = True
-            self.top_zone.editable = False
-            if self.top_zone._btn_edit: self.top_zone._btn_edit.grid_remove()
-            if was_running:
-                self.top_zone.btn_s.configure(text="⏸  PAUSE",
-                    fg_color="#e67e22", hover_color="#ca6f1e", text_color="#ffffff",
-                    command=self._on_pause)
-            else:
-                self.top_zone.btn_s.configure(text="▶  RESUME",
-                    fg_color=self.c["btn_start_bg"], hover_color="#27a85e",
-                    text_color=self.c["btn_start_fg"], command=self._on_resume)
-            self.top_zone.btn_p.configure(fg_color=self.c["btn_stop_bg"], hover_color="#c0392b",
-                text_color=self.c["btn_stop_fg"], text="■  STOP / RESET",
-                command=self._on_reset)
-            self.btn_settings.configure(state="disabled")
-
-        if bot_running:
-            self.bot_zone.running  = True
-            self.bot_zone.editable = False
-            if self._spk_paused:
-                self.bot_zone.btn_spk_pause.configure(text="▶  RESUME",
-                    fg_color=self.c["btn_start_bg"], hover_color="#27a85e",
-                    text_color=self.c["btn_start_fg"], command=self._on_spk_resume)
-                self.bot_zone.btn_n.configure(fg_color=self.c["btn_next_bg"], hover_color="#2a7ac0",
-                    text_color=self.c["btn_next_fg"], command=self._on_next_while_paused)
-            else:
-                self.bot_zone.btn_spk_pause.configure(text="⏸  PAUSE",
-                    fg_color="#e67e22", hover_color="#ca6f1e", text_color="#ffffff",
-                    command=self._on_spk_pause)
-                self.bot_zone.btn_n.configure(fg_color=self.c["btn_next_bg"], hover_color="#2a7ac0",
-                    text_color=self.c["btn_next_fg"], command=self._on_next)
+        self._apply_scale(fs)
+        self.top_zone.rescale(fs); self.bot_zone.rescale(fs)
+        if self._settings_open:            # transient popup — simplest to reopen at the new size
+            self._close_settings(); self._open_settings()
 
     def _build_ui(self, fs):
         c = self.c; self.configure(fg_color=c["bg"])
-        tb = ctk.CTkFrame(self, fg_color=c["title_bg"], height=int(38*fs), corner_radius=0)
+        FONTS.set_scale(fs); SHAPES.set_scale(fs)
+        self._title_bar = tb = ctk.CTkFrame(self, fg_color=c["title_bg"], corner_radius=0)
         tb.pack(fill="x"); tb.pack_propagate(False)
-        ctk.CTkLabel(tb, text="", width=int(80*fs)).pack(side="left")
-        ctk.CTkLabel(tb, text="PODCAST  TIMER",
-                     font=ctk.CTkFont("Space Mono", int(10*fs), weight="bold"),
-                     text_color=c["text_sub"]).pack(side="left", expand=True)
-        self.btn_settings = ctk.CTkButton(tb, text="Settings", width=int(80*fs), height=int(28*fs),
-                      font=ctk.CTkFont("Space Mono", int(12*fs), weight="bold"),
+        self._title_spacer = ctk.CTkLabel(tb, text="")
+        self._title_spacer.pack(side="left")
+        self._title_lbl = ctk.CTkLabel(tb, text="PODCAST  TIMER", font=FONTS.get(10, "bold"),
+                                       text_color=c["text_sub"])
+        self._title_lbl.pack(side="left", expand=True)
+        self.btn_settings = ctk.CTkButton(tb, text="Settings", font=FONTS.get(12, "bold"),
                       fg_color="transparent", hover_color=c["bar_track"],
                       text_color=c["text_sub"], command=self._toggle_settings)
         self.btn_settings.pack(side="right", padx=8)
@@ -804,28 +2481,42 @@ class PodcastTimerApp(ctk.CTk):
         # Dismiss button on the right, fixed width
         ctk.CTkButton(self._update_banner, text="✕", width=24, height=20,
             fg_color="transparent", hover_color="#2a3a00", text_color="#a8e063",
-            font=ctk.CTkFont("Space Mono", int(10*fs)),
+            font=FONTS.get(10),
             command=self._dismiss_update_banner).pack(side="right", padx=8, pady=4)
         # Label expands to fill remaining space and centers its text
         self._update_banner_label = ctk.CTkLabel(
             self._update_banner, text="", cursor="hand2",
-            font=ctk.CTkFont("Space Mono", int(10*fs)),
-            text_color="#a8e063", anchor="center")
+            font=FONTS.get(10), text_color="#a8e063", anchor="center")
         self._update_banner_label.pack(side="left", fill="x", expand=True, pady=4)
         self._update_banner_label.bind("<Button-1>", lambda e: webbrowser.open(RELEASES_URL))
 
         self.main_frame = ctk.CTkFrame(self, fg_color="transparent")
-        self.main_frame.pack(fill="both", expand=True, padx=int(16*fs), pady=int(8*fs))
+        self.main_frame.pack(fill="both", expand=True)
         self.top_zone = TimerZone(self.main_frame, "Episode Timer", fs, True, c,
                                   on_start=self._on_start, on_stop=self._on_reset)
         self.top_zone.on_pause = self._on_pause
         self.top_zone.on_edit  = self._on_edit_both
-        self.top_zone.pack(fill="x", pady=(0, int(12*fs)))
-        ctk.CTkFrame(self.main_frame, height=1, fg_color=c["bar_track"]).pack(
-            fill="x", padx=int(40*fs), pady=int(6*fs))
+        self.top_zone.on_commit = self._publish_state
+        self.top_zone.pack(fill="x")
+        self._zone_sep = ctk.CTkFrame(self.main_frame, height=1, fg_color=c["bar_track"])
+        self._zone_sep.pack(fill="x")
         self.bot_zone = TimerZone(self.main_frame, "Speaker Timer", fs, False, c, on_next=self._on_next)
         self.bot_zone.on_spk_pause = self._on_spk_pause
-        self.bot_zone.pack(fill="x", pady=(int(6*fs), 0))
+        self.bot_zone.on_commit = self._publish_state
+        self.bot_zone.pack(fill="x")
+        self._apply_scale(fs)
+        if self._available_version: self._show_update_banner(self._available_version)
+
+    def _apply_scale(self, fs):
+        """Set the fonts, title bar and layout sizes that depend on the zoom factor."""
+        FONTS.set_scale(fs); SHAPES.set_scale(fs)
+        self._title_bar.configure(height=int(38*fs))
+        self._title_spacer.configure(width=int(80*fs))
+        self.btn_settings.configure(width=int(80*fs), height=int(28*fs))
+        self.main_frame.pack(padx=int(16*fs), pady=int(8*fs))
+        self.top_zone.pack(pady=(0, int(12*fs)))
+        self._zone_sep.pack(padx=int(40*fs), pady=int(6*fs))
+        self.bot_zone.pack(pady=(int(6*fs), 0))
 
     def _toggle_settings(self):
         if self._settings_open: self._close_settings()
@@ -833,8 +2524,7 @@ class PodcastTimerApp(ctk.CTk):
 
     def _open_settings(self):
         self._settings_open = True
-        self.top_zone.btn_s.configure(fg_color="#1a2e1a", hover_color="#1a2e1a",
-                                     text_color="#2a4a2a", cursor="arrow")
+        self.top_zone.set_button(self.top_zone.btn_s, "start_off", cursor="arrow")
         fs = self._get_fs()
         self.settings_panel = SettingsPanel(self, self.settings, self.c, fs,
                                             on_apply=self._on_settings_apply, on_cancel=self._close_settings)
@@ -847,15 +2537,13 @@ class PodcastTimerApp(ctk.CTk):
 
     def _close_settings(self):
         self._settings_open = False
-        self.top_zone.btn_s.configure(fg_color=self.c["btn_start_bg"],
-                                     hover_color="#27a85e",
-                                     text_color=self.c["btn_start_fg"], cursor="hand2")
+        self.top_zone.set_button(self.top_zone.btn_s, "start", cursor="hand2")
         if hasattr(self, "settings_panel"): self.settings_panel.destroy()
 
     def _on_settings_apply(self, ns):
         ns["top_minutes"] = self.top_zone.edit_min; ns["top_seconds"] = self.top_zone.edit_sec
         ns["bot_minutes"] = self.bot_zone.edit_min; ns["bot_seconds"] = self.bot_zone.edit_sec
-        self._apply_settings(ns)
+        self.perf.measure("apply", self._apply_settings, ns)
 
     def _on_edit_both(self):
         self.top_zone._start_edit_local()
@@ -875,66 +2563,82 @@ class PodcastTimerApp(ctk.CTk):
         self.settings["bot_minutes"] = self.bot_zone.edit_min
         self.settings["bot_seconds"] = self.bot_zone.edit_sec
         save_settings(self.settings)
+        self.engine.start(self.top_zone.total_sec, self.bot_zone.total_sec)
+        self.journal.begin(self.engine.clock(), self.top_zone.total_sec, self.bot_zone.total_sec)
+        self._last_snap = self.engine.clock()
         self.top_zone.start_timer(); self.bot_zone.start_timer()
         self.btn_settings.configure(state="disabled")
-        if not self._clock_running:
-            self._clock_running = True
-            threading.Thread(target=self._clock_loop, daemon=True).start()
-        self._pulse_loop(); self._blink_loop()
+        self._clock_running = True
+        self._start_loops()
+        self._vad_sync()
+        self._publish_state()
 
     def _on_pause(self):
         if self._clock_running:
             self._clock_running = False
             self._spk_paused = False
-            self.top_zone.btn_s.configure(text="▶  RESUME",
-                fg_color=self.c["btn_start_bg"], hover_color="#27a85e",
-                text_color=self.c["btn_start_fg"], command=self._on_resume)
-            self.bot_zone.btn_spk_pause.configure(text="⏸  PAUSE",
-                fg_color="#2a1a00", hover_color="#2a1a00", text_color="#3a2a00",
+            self.engine.pause()
+            self._journal("pause")
+            self._stop_loops()
+            self.top_zone.set_button(self.top_zone.btn_s, "start", text="▶  RESUME",
+                command=self._on_resume)
+            self.bot_zone.set_button(self.bot_zone.btn_spk_pause, "spk_off", text="⏸  PAUSE",
                 command=lambda: None)
-            self.bot_zone.btn_n.configure(fg_color="#1a2030", hover_color="#1a2030",
-                text_color="#2a3a50", cursor="arrow")
+            self.bot_zone.set_button(self.bot_zone.btn_n, "next_off", cursor="arrow")
+        self._publish_state()
 
     def _on_resume(self):
         self._clock_running = True
-        self.top_zone.btn_s.configure(text="⏸  PAUSE",
-            fg_color="#e67e22", hover_color="#ca6f1e", text_color="#ffffff",
+        self.engine.resume()
+        self._journal("resume")
+        self.top_zone.set_button(self.top_zone.btn_s, "pause", text="⏸  PAUSE",
             command=self._on_pause)
-        self.bot_zone.btn_spk_pause.configure(text="⏸  PAUSE",
-            fg_color="#e67e22", hover_color="#ca6f1e", text_color="#ffffff",
+        self.bot_zone.set_button(self.bot_zone.btn_spk_pause, "pause", text="⏸  PAUSE",
             command=self._on_spk_pause)
-        self.bot_zone.btn_n.configure(fg_color=self.c["btn_next_bg"], hover_color="#2a7ac0",
-            text_color=self.c["btn_next_fg"], cursor="hand2", command=self._on_next)
-        threading.Thread(target=self._clock_loop, daemon=True).start()
-        self._pulse_loop(); self._blink_loop()
+        self.bot_zone.set_button(self.bot_zone.btn_n, "next", cursor="hand2", command=self._on_next)
+        self._start_loops()
+        self._vad_sync()
+        self._publish_state()
 
     def _on_spk_pause(self):
         self._spk_paused = True
-        self.bot_zone.btn_spk_pause.configure(text="▶  RESUME",
-            fg_color=self.c["btn_start_bg"], hover_color="#27a85e",
-            text_color=self.c["btn_start_fg"], command=self._on_spk_resume)
+        self.engine.pause_speaker()
+        self._journal("spk_pause")
+        self.bot_zone.set_button(self.bot_zone.btn_spk_pause, "start", text="▶  RESUME",
+            command=self._on_spk_resume)
         self.bot_zone.btn_n.configure(command=self._on_next_while_paused)
+        self._publish_state()
 
     def _on_spk_resume(self):
         self._spk_paused = False
-        self.bot_zone.btn_spk_pause.configure(text="⏸  PAUSE",
-            fg_color="#e67e22", hover_color="#ca6f1e", text_color="#ffffff",
+        self.engine.resume_speaker()
+        self._journal("spk_resume")
+        self._update_tenths()
+        self.bot_zone.set_button(self.bot_zone.btn_spk_pause, "pause", text="⏸  PAUSE",
             command=self._on_spk_pause)
         self.bot_zone.btn_n.configure(command=self._on_next)
+        self._publish_state()
 
     def _on_next_while_paused(self):
         """NEXT/RESET clicked while speaker is paused — reset and resume immediately."""
         self._spk_paused = False
+        self.engine.next_speaker()
+        self._journal("next")
         self.bot_zone.reset_speaker()
-        self.bot_zone.btn_spk_pause.configure(text="⏸  PAUSE",
-            fg_color="#e67e22", hover_color="#ca6f1e", text_color="#ffffff",
+        self.bot_zone.set_button(self.bot_zone.btn_spk_pause, "pause", text="⏸  PAUSE",
             command=self._on_spk_pause)
         self.bot_zone.btn_n.configure(command=self._on_next)
         self._update_bg(self.top_zone.stage)
+        self._update_pulse()
+        self._vad_sync()
+        self._publish_state()
 
     def _on_reset(self):
         self._clock_running = False
         self._spk_paused = False
+        self.engine.reset()
+        self.journal.discard()
+        self._stop_loops()
         self.top_zone.stop_timer(); self.bot_zone.stop_timer()
         self.top_zone.remain_sec = self.top_zone.total_sec
         self.bot_zone.remain_sec = self.bot_zone.total_sec
@@ -944,61 +2648,184 @@ class PodcastTimerApp(ctk.CTk):
         self.top_zone._apply_stage(); self.bot_zone._draw_bar()
         self.configure(fg_color=self.c["bg"])
         self.btn_settings.configure(state="normal")
-        self.top_zone.btn_p.configure(text="■  STOP",
-            fg_color="#2a1a1a", hover_color="#2a1a1a",
-            text_color="#553333", command=lambda: None)
+        self.top_zone.set_button(self.top_zone.btn_p, "stop_off", text="■  STOP", command=lambda: None)
+        self._publish_state()
 
     def _on_next(self):
         self._spk_paused = False
+        self.engine.next_speaker()
+        self._journal("next")
         self.bot_zone.reset_speaker()
-        self.bot_zone.btn_spk_pause.configure(text="⏸  PAUSE",
-            fg_color="#e67e22", hover_color="#ca6f1e", text_color="#ffffff",
+        self.bot_zone.set_button(self.bot_zone.btn_spk_pause, "pause", text="⏸  PAUSE",
             command=self._on_spk_pause)
         self._update_bg(self.top_zone.stage)
-
-    def _clock_loop(self):
-        while self._clock_running:
-            time.sleep(1)
-            if not self._clock_running: break
-            self.after(0, self._tick)
+        self._update_pulse()
+        self._vad_sync()
+        self._publish_state()
+
+    def _start_loops(self):
+        """Register the clock/blink jobs (and pulse if needed); registered jobs are left alone."""
+        self.sched.every("clock", 1000, self._tick, first_ms=self._next_tick_ms())
+        self.sched.every("blink", 500, self._blink_step)
+        self._update_pulse(); self._update_tenths()
+
+    def _update_pulse(self):
+        """Run the pulse job only while the clock runs and a zone is red/done, at the capped rate."""
+        if not (self._clock_running and
+                (self.top_zone.stage in ("red", "done") or self.bot_zone.stage in ("red", "done"))):
+            self.sched.cancel("pulse"); return
+        fps = max(1, int(self.settings.get("max_fps", 25)))
+        if self._hidden and self.settings.get("low_power", True): fps = min(fps, LOW_POWER_FPS)
+        interval = max(10, 1000 // fps)
+        # Keep the pulse period (~1.3 s) independent of the frame rate
+        self._pulse_stride = max(1, round(interval / 40))
+        job = self.sched.every("pulse", interval, self._pulse_step)
+        job.interval_ms = interval        # an already-running job picks up the new rate next frame
+
+    def _stop_loops(self):
+        for name in ("clock", "pulse", "blink", "tenths"): self.sched.cancel(name)
+
+    def _update_tenths(self):
+        """Run the 10 Hz tenths job while a running zone is within its last tenths_sec seconds."""
+        n = self.settings.get("tenths_sec", 0)
+        zones = ((self.top_zone, self.engine.top), (self.bot_zone, self.engine.bot))
+        if n and self._clock_running and any(zc.running and 0 < z.remain_sec <= n + 1 for z, zc in zones):
+            self.sched.every("tenths", 100, self._tenths_step, first_ms=0)
+
+    def _tenths_step(self):
+        """Update only the seconds labels; returns the delay to the next tenth boundary."""
+        n = self.settings.get("tenths_sec", 0)
+        if not (n and self._clock_running):
+            self.top_zone.hide_tenths(); self.bot_zone.hide_tenths(); return False
+        now = self.engine.clock(); wait = None
+        for z, zc in ((self.top_zone, self.engine.top), (self.bot_zone, self.engine.bot)):
+            rem = zc.remain_exact(now)
+            if 0 < rem <= n:
+                z.show_tenths(int(rem * 10))
+                if zc.running:
+                    w = rem * 10 - int(rem * 10)
+                    wait = w if wait is None else min(wait, w)
+            else: z.hide_tenths()
+        if wait is None: return False      # nothing running in the window; resume paths restart it
+        return int(wait * 100) + 2
+
+    def _next_tick_ms(self):
+        # Wake at the engine's next whole-second deadline rather than a fixed
+        # second later, so late callbacks never accumulate into display drift.
+        wait = self.engine.until_next()
+        return 1000 if wait is None else int(wait * 1000) + 2
+
+    def _advance_zones(self):
+        """Show the engine's remaining time on both zones; returns tick_decision()'s (stages, cue)."""
+        zones = (self.top_zone, self.bot_zone); rem = self.engine.remain()
+        new, cue = tick_decision([z.stage if z.running and r != z.remain_sec else None for z, r in zip(zones, rem)],
+                                 rem, [z.total_sec for z in zones])
+        for z, r, st in zip(zones, rem, new): z.tick(r, st)
+        return new, cue
 
     def _tick(self):
-        if not self._clock_running: return
-        top_new = self.top_zone.tick()
-        bot_new = self.bot_zone.tick() if not self._spk_paused else None
-        if self.settings.get("audio_enabled", True):
-            for stage in filter(None, [top_new, bot_new]):
-                if stage=="yellow": beep_yellow()
-                elif stage=="red":  beep_red()
-                elif stage=="done": beep_done()
+        if not self._clock_running: return False
+        calls0 = self.top_zone.tk_calls + self.bot_zone.tk_calls
+        (top_new, bot_new), cue = self._advance_zones()
+        self.tick_tk_calls = self.top_zone.tk_calls + self.bot_zone.tk_calls - calls0
+        self._update_tenths()
+        if top_new or bot_new:
+            self._update_pulse()
+            if top_new: self._journal("stage", zone="top", stage=top_new)
+            if bot_new: self._journal("stage", zone="bot", stage=bot_new)
+            if self.osc is not None:
+                if top_new: self.osc.send("/timer/stage", "top", top_new)
+                if bot_new: self.osc.send("/timer/stage", "bot", bot_new)
+        if self.engine.clock() - self._last_snap >= SNAPSHOT_SEC: self._journal_snapshot()
+        if cue and self.settings.get("audio_enabled", True): AUDIO.cue(cue)
         self._update_bg(self.top_zone.stage)
+        self._publish_state()
+        return self._next_tick_ms()
 
     def _update_bg(self, stage):
         pass
 
-    def _pulse_loop(self):
-        if not self._clock_running: return
-        self._pulse_val += self._pulse_dir * 0.06
-        if self._pulse_val >= 1.0: self._pulse_val = 1.0; self._pulse_dir = -1
-        if self._pulse_val <= 0.0: self._pulse_val = 0.0; self._pulse_dir =  1
-        a = self._pulse_val
-        self.top_zone.pulse_tick(a); self.bot_zone.pulse_tick(a)
-        if self.top_zone.stage == "done":
-            pulse_bg = _blend(self.c["bg_red"], self.c["zone_bg"], 1.0 - a*0.6)
-            self.top_zone.configure(fg_color=pulse_bg)
-        if self.bot_zone.stage == "done":
-            pulse_bg = _blend(self.c["bg_red"], self.c["zone_bg"], 1.0 - a*0.6)
-            self.bot_zone.configure(fg_color=pulse_bg)
-        self.after(40, self._pulse_loop)
-
-    def _blink_loop(self):
-        if not self._clock_running: return
+    def _pulse_step(self):
+        if not self._clock_running: return False
+        i = self._pulse_i + self._pulse_dir * self._pulse_stride
+        if i >= PULSE_STEPS: i = PULSE_STEPS; self._pulse_dir = -1
+        if i <= 0:           i = 0;           self._pulse_dir =  1
+        self._pulse_i = i
+        self.top_zone.pulse_tick(i); self.bot_zone.pulse_tick(i)
+
+    def _blink_step(self):
+        if not self._clock_running: return False
         self._colon_visible = not self._colon_visible
-        self.after(500, self._blink_loop)
 
 
 # ── Entry point ───────────────────────────────────────────────────────────
+def _run_headless_sync(args, period=0.5):
+    """Leader or follower without Tk, printing both timers; for testing sync across processes."""
+    eng_lock = threading.Lock()
+    if args.sync_lead:
+        s = load_settings(); eng = TimerEngine(); lead = SyncLeader(args.sync_lead)
+        eng.start(s["top_minutes"]*60 + s["top_seconds"], s["bot_minutes"]*60 + s["bot_seconds"])
+        role = lambda: f"leader followers={len(lead.followers)}"
+    else:
+        eng = None
+        def on_state(st):
+            with eng_lock:
+                if eng is None: return
+                if st.get("status") == "ready": eng.reset(); return
+                eng.restore(st["snap"], at=st["at"])
+        fol = SyncFollower(args.sync_follow, on_state); eng = TimerEngine(fol.clock)
+        role = lambda: (f"offset={fol.offset*1000:+.3f}ms delay={fol.delay*1000:.3f}ms"
+                        if fol.delay is not None else "waiting for leader")
+    try:
+        while True:
+            with eng_lock:
+                now = eng.clock(); top_el, bot_el = eng.top.elapsed(now), eng.bot.elapsed(now)
+                tr, br = eng.top.remain(now), eng.bot.remain(now)
+                stages = stage_for(tr, eng.top.total_sec), stage_for(br, eng.bot.total_sec)
+            if args.sync_lead: lead.publish({"status": "running", "snap": eng.snapshot(now), "at": now})
+            print(f"top {tr//60:02d}:{tr%60:02d} ({top_el:9.3f}s) {stages[0]:<6}  "
+                  f"bot {br//60:02d}:{br%60:02d} ({bot_el:9.3f}s) {stages[1]:<6}  {role()}", flush=True)
+            time.sleep(period)
+    except KeyboardInterrupt: pass
+
+def _parse_args(argv=None):
+    ap = argparse.ArgumentParser(description="Podcast Timer")
+    ap.add_argument("--startup-times", action="store_true",
+                    help="print per-phase startup timings once the app is ready")
+    ap.add_argument("--perf-overlay", action="store_true",
+                    help="show callback timing/lateness histograms (toggle with Ctrl+Shift+P)")
+    ap.add_argument("--control-port", type=int, metavar="PORT",
+                    help="serve the localhost control API / SSE state stream on PORT (0 = off; "
+                         "default: control_port in settings.json)")
+    ap.add_argument("--osc-port", type=int, metavar="PORT",
+                    help="listen for OSC commands on UDP PORT (0 = off; default: osc_port in settings.json)")
+    ap.add_argument("--sync-lead", type=int, metavar="PORT",
+                    help="be the sync leader: serve this instance's timers to followers on UDP PORT")
+    ap.add_argument("--sync-follow", metavar="HOST:PORT",
+                    help="follow the sync leader at HOST:PORT (display mirrors the leader)")
+    ap.add_argument("--headless", action="store_true",
+                    help="with --sync-lead/--sync-follow: run the sync without a window and print the timers")
+    ap.add_argument("--vad", metavar="SOURCE",
+                    help="run the speaker timer only while voice is detected; SOURCE is a .wav file "
+                         "or 'mic' (needs the sounddevice package)")
+    ap.add_argument("--simulate", action="store_true",
+                    help="fast-forward an episode with the saved durations and print its stage/cue timeline")
+    return ap.parse_args(argv)
+
 if __name__ == "__main__":
+    args = _parse_args()
+    if args.simulate:
+        s = load_settings(); t = time.perf_counter()
+        events = simulate_episode(s["top_minutes"]*60 + s["top_seconds"],
+                                  s["bot_minutes"]*60 + s["bot_seconds"], auto_next=5)
+        for e in events:
+            extra = " ".join(f"{k}={v}" for k, v in e.items() if k not in ("t", "ev"))
+            print(f"{int(e['t'])//60:4d}:{int(e['t'])%60:02d}  {e['ev']:<6} {extra}")
+        print(f"simulated in {(time.perf_counter()-t)*1000:.1f} ms"); sys.exit(0)
+    if args.headless and (args.sync_lead or args.sync_follow):
+        _run_headless_sync(args); sys.exit(0)
     ctk.set_default_color_theme("blue")
-    app = PodcastTimerApp()
+    app = PodcastTimerApp(startup_times=args.startup_times, perf_overlay=args.perf_overlay,
+                          control_port=args.control_port, osc_port=args.osc_port,
+                          sync_lead=args.sync_lead, sync_follow=args.sync_follow, vad=args.vad)
     app.mainloop()
@@ -0,0 +1,4 @@
+import os, sys
+
+# podcast_timer.py is a single-file app at the repo root, not an installed package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
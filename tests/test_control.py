@@ -0,0 +1,64 @@
+"""ControlServer over loopback HTTP: Host check, POST-only /api, SSE initial state."""
+import json, socket
+
+import pytest
+
+from podcast_timer import ControlServer
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0)); return s.getsockname()[1]
+
+
+@pytest.fixture
+def server():
+    posted = []
+    srv = ControlServer(lambda fn, *a: posted.append((fn, a)), "command", port=free_port())
+    assert srv.start()
+    srv.posted = posted
+    yield srv
+    srv.stop()
+
+
+def request(srv, method, path, host=None, read_all=True):
+    s = socket.create_connection(("127.0.0.1", srv.port), timeout=3)
+    host = host or f"127.0.0.1:{srv.port}"
+    s.sendall(f"{method} {path} HTTP/1.1\r\nHost: {host}\r\nContent-Length: 0\r\n\r\n".encode())
+    if not read_all: return s
+    data = b""
+    while chunk := s.recv(4096): data += chunk
+    s.close()
+    head, _, body = data.partition(b"\r\n\r\n")
+    return int(head.split()[1]), head.decode("latin-1"), body
+
+
+def test_foreign_host_is_forbidden(server):
+    code, _, _ = request(server, "POST", "/api/start", host=f"evil.example:{server.port}")
+    assert code == 403 and server.posted == []
+    code, _, _ = request(server, "GET", "/state", host="attacker.test")
+    assert code == 403
+
+
+def test_api_is_post_only(server):
+    code, head, _ = request(server, "GET", "/api/start")
+    assert code == 405 and "Access-Control-Allow-Origin" not in head
+    assert server.posted == []
+    code, _, body = request(server, "POST", "/api/start")
+    assert code == 202 and json.loads(body) == {"ok": True, "command": "start"}
+    assert server.posted == [("command", ("start",))]
+    assert request(server, "POST", "/api/launch")[0] == 404
+
+
+def test_state_and_event_stream_start_with_current_state(server):
+    server.publish({"top": 600, "stage": "great"})
+    code, head, body = request(server, "GET", "/state")
+    assert code == 200 and json.loads(body)["top"] == 600
+    assert "Access-Control-Allow-Origin: *" in head
+    s = request(server, "GET", "/events", read_all=False)
+    data = b""
+    while b"\n\n" not in data.partition(b"\r\n\r\n")[2]: data += s.recv(4096)
+    s.close()
+    head, _, events = data.partition(b"\r\n\r\n")
+    assert b"text/event-stream" in head
+    assert json.loads(events.split(b"\n\n")[0][len(b"data: "):]) == {"top": 600, "stage": "great"}
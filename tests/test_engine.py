@@ -0,0 +1,70 @@
+"""TimerEngine / ZoneClock on a virtual clock: pause, resume, speaker pause, catch-up."""
+import pytest
+
+from podcast_timer import SimClock, TimerEngine
+
+
+@pytest.fixture
+def eng():
+    clock = SimClock()
+    e = TimerEngine(clock)
+    e.start(600, 120)
+    return e
+
+
+def test_counts_down_from_totals(eng):
+    assert eng.remain() == (600, 120)
+    eng.clock.advance(10.5)
+    assert eng.remain() == (590, 110)
+
+
+def test_pause_freezes_both_and_resume_continues(eng):
+    eng.clock.advance(30)
+    eng.pause()
+    eng.clock.advance(300)
+    assert eng.remain() == (570, 90)
+    assert eng.until_next() is None
+    eng.resume()
+    eng.clock.advance(5)
+    assert eng.remain() == (565, 85)
+
+
+def test_partial_seconds_survive_pause(eng):
+    for _ in range(4):                      # 4 × 0.5 s of running, split by pauses
+        eng.clock.advance(0.5); eng.pause()
+        eng.clock.advance(10); eng.resume()
+    assert eng.remain() == (598, 118)
+
+
+def test_speaker_pause_keeps_episode_running(eng):
+    eng.clock.advance(10)
+    eng.pause_speaker()
+    eng.clock.advance(20)
+    assert eng.remain() == (570, 110)
+    eng.resume_speaker()
+    eng.clock.advance(1)
+    assert eng.remain() == (569, 109)
+
+
+def test_next_speaker_restarts_only_speaker(eng):
+    eng.clock.advance(50)
+    eng.next_speaker()
+    assert eng.remain() == (550, 120)
+
+
+def test_catch_up_after_stall(eng):
+    # A caller that doesn't poll for a long time reads the true time, not a per-tick count
+    eng.clock.advance(0.2)
+    eng.clock.advance(200)
+    assert eng.remain() == (400, 0)
+    assert eng.until_next() == pytest.approx(0.8)
+
+
+def test_snapshot_restore_projects_running_time(eng):
+    eng.clock.advance(42)
+    snap, at = eng.snapshot(), eng.clock.now
+    eng.clock.advance(8)
+    other = TimerEngine(eng.clock)
+    other.restore(snap, at=at)
+    assert other.remain() == eng.remain() == (550, 70)
+    assert other.drift(snap, at) == pytest.approx(0.0)
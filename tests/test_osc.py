@@ -0,0 +1,89 @@
+"""OscListener parsing of well-formed, truncated and hostile datagrams."""
+import socket, struct, threading
+
+import pytest
+
+from podcast_timer import OSC_MAX_DEPTH, OscListener, osc_message
+
+
+@pytest.fixture
+def osc():
+    got = []
+    # No Tk root: the listener falls back to its receive thread, which these tests don't use
+    lst = OscListener(object(), lambda fn, *a: fn(*a), got.append, 0, host="127.0.0.1")
+    lst.got = got
+    yield lst
+    lst.close()
+
+
+def feed(lst, data):
+    """Run one datagram through the listener's Tk-thread path, failing if parsing hangs."""
+    t = threading.Thread(target=lst._on_datagram, args=(data, ("127.0.0.1", 9)), daemon=True)
+    t.start(); t.join(2)
+    assert not t.is_alive(), "OSC parser hung"
+
+
+def bundle(*elements):
+    return b"#bundle\0" + b"\0" * 8 + b"".join(struct.pack(">i", len(e)) + e for e in elements)
+
+
+def test_routes_and_release(osc):
+    feed(osc, osc_message("/timer/start"))
+    feed(osc, osc_message("/speaker/pause", 1))
+    feed(osc, osc_message("/timer/next", 0))            # button release
+    feed(osc, osc_message("/timer/next", 0.0))
+    feed(osc, osc_message("/unknown/address", 1))
+    assert osc.got == ["start", "spk_pause"]
+
+
+def test_bundle_elements_dispatch(osc):
+    feed(osc, bundle(osc_message("/timer/pause", 1), osc_message("/timer/reset")))
+    assert osc.got == ["pause", "reset"]
+
+
+@pytest.mark.parametrize("size", [-4, -1, 0, 3, 6, 4096, 2**31 - 1, -2**31])
+def test_bad_bundle_sizes_are_dropped(osc, size):
+    msg = osc_message("/timer/start")
+    feed(osc, b"#bundle\0" + b"\0" * 8 + struct.pack(">i", size) + msg)
+    assert osc.got == []
+
+
+def test_bad_size_drops_rest_but_keeps_earlier_elements(osc):
+    good = osc_message("/timer/start")
+    feed(osc, bundle(good) + struct.pack(">i", -4) + good)
+    assert osc.got == ["start"]
+
+
+def test_nesting_is_capped(osc):
+    msg = osc_message("/timer/next")
+    ok = msg
+    for _ in range(OSC_MAX_DEPTH): ok = bundle(ok)
+    deep = bundle(ok)
+    feed(osc, ok); feed(osc, deep)
+    assert osc.got == ["next"]
+
+
+def test_truncated_datagrams(osc):
+    msg = osc_message("/timer/start", 1)
+    for n in range(len(msg)):
+        feed(osc, msg[:n])
+    # Cut right after the address it is a valid no-argument message; every other cut is ignored
+    assert osc.got == ["start"]
+    assert osc.received == len(msg)
+
+
+def test_stale_buffer_bytes_do_not_match(osc):
+    feed(osc, osc_message("/timer/start"))
+    feed(osc, b"/tim")                                  # rest of the buffer still holds the old message
+    assert osc.got == ["start"]
+
+
+def test_ping_is_answered_with_pong(osc):
+    port = osc.sock.getsockname()[1]
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as c:
+        c.settimeout(2); c.bind(("127.0.0.1", 0))
+        ping = osc_message("/timer/ping", 7)
+        osc._on_datagram(ping, c.getsockname())
+        data, addr = c.recvfrom(256)
+    assert data == osc_message("/timer/pong", 7)
+    assert addr[1] == port
@@ -0,0 +1,52 @@
+"""stage_for() thresholds and the simulate_episode() stage/cue timeline."""
+from podcast_timer import simulate_episode, stage_for, tick_decision
+
+
+def test_stage_for_thresholds():
+    assert stage_for(100, 100) == "great"
+    assert stage_for(26, 100) == "great"
+    assert stage_for(25, 100) == "yellow"
+    assert stage_for(10, 100) == "red"
+    assert stage_for(0, 100) == "done"
+    assert stage_for(0, 0) == "done"
+
+
+def _cues(events):
+    return [(e["t"], e["cue"]) for e in events if e["ev"] == "cue"]
+
+
+def test_cue_timeline_for_one_speaker():
+    ev = simulate_episode(600, 100)
+    bot = [(round(e["t"]), e["stage"]) for e in ev if e["ev"] == "stage" and e["zone"] == "bot"]
+    assert bot == [(75, "yellow"), (90, "red"), (100, "done")]
+    top = [(round(e["t"]), e["stage"]) for e in ev if e["ev"] == "stage" and e["zone"] == "top"]
+    assert top == [(450, "yellow"), (540, "red"), (600, "done")]
+    assert [c for _, c in _cues(ev)] == ["yellow", "red", "done", "yellow", "red", "done"]
+    assert ev[-1]["ev"] == "cue" and ev[-1]["cue"] == "done"
+
+
+def test_pause_shifts_the_timeline():
+    ev = simulate_episode(600, 100, script=[(50, "pause"), (80, "resume")])
+    assert [(round(t), c) for t, c in _cues(ev)][:3] == [(105, "yellow"), (120, "red"), (130, "done")]
+
+
+def test_auto_next_restarts_speaker_cues():
+    ev = simulate_episode(300, 100, auto_next=5, until=250)
+    nexts = [round(e["t"]) for e in ev if e["ev"] == "next"]
+    assert nexts == [105, 210]
+    bot_done = [round(t) for t, c in _cues(ev) if c == "done"]
+    assert bot_done == [100, 205]
+
+
+def test_tick_decision_merges_simultaneous_cues():
+    assert tick_decision(("great", "yellow"), (25, 10), (100, 100)) == (("yellow", "red"), "red")
+    assert tick_decision(("great", None), (25, 10), (100, 100)) == (("yellow", None), "yellow")
+    assert tick_decision(("red", "red"), (5, 5), (100, 100)) == ((None, None), None)
+
+
+def test_zones_crossing_together_play_one_cue():
+    ev = simulate_episode(100, 100)
+    stages = [(round(e["t"]), e["zone"], e["stage"]) for e in ev if e["ev"] == "stage"]
+    assert stages == [(75, "top", "yellow"), (75, "bot", "yellow"), (90, "top", "red"),
+                      (90, "bot", "red"), (100, "top", "done"), (100, "bot", "done")]
+    assert [(round(t), c) for t, c in _cues(ev)] == [(75, "yellow"), (90, "red"), (100, "done")]
@@ -0,0 +1,77 @@
+"""SyncLeader / SyncFollower over loopback UDP: offset estimate and state hand-off."""
+import json, socket, threading, time
+
+import pytest
+
+from podcast_timer import SyncFollower, SyncLeader, TimerEngine, sync_durations
+
+SKEW = 123.4   # the leader's clock runs this far ahead of the follower's
+
+
+def wait_for(cond, timeout=3.0):
+    end = time.monotonic() + timeout
+    while time.monotonic() < end:
+        if cond(): return True
+        time.sleep(0.01)
+    return False
+
+
+@pytest.fixture
+def pair():
+    leader = SyncLeader(0, host="127.0.0.1", clock=lambda: time.monotonic() + SKEW)
+    states = []; got = threading.Event()
+    def on_state(st): states.append(st); got.set()
+    follower = SyncFollower(f"127.0.0.1:{leader.sock.getsockname()[1]}", on_state)
+    follower.states = states; follower.got = got
+    yield leader, follower
+    follower.sock.close(); leader.sock.close()
+
+
+def test_follower_recovers_clock_offset(pair):
+    leader, follower = pair
+    assert wait_for(lambda: follower.delay is not None)
+    assert follower.offset == pytest.approx(SKEW, abs=0.005)
+    assert abs(follower.clock() - leader.clock()) < 0.005
+    assert len(leader.followers) == 1
+
+
+def test_published_state_reaches_follower_on_leader_timeline(pair):
+    leader, follower = pair
+    assert wait_for(lambda: leader.followers and follower.delay is not None)
+    eng = TimerEngine(leader.clock); eng.start(600, 120)
+    time.sleep(0.05)
+    leader.publish({"status": "running", "snap": eng.snapshot(), "at": leader.clock()})
+    assert follower.got.wait(2)
+    st = follower.states[-1]
+    mirror = TimerEngine(follower.clock)
+    mirror.restore(st["snap"], at=st["at"])
+    assert mirror.drift(eng.snapshot(), leader.clock()) < 0.01
+
+
+def test_leader_ignores_garbage(pair):
+    leader, follower = pair
+    port = leader.sock.getsockname()[1]
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as c:
+        c.settimeout(2)
+        for junk in (b"\xff\x00", b"[1, 2]", b'{"op": "nope"}', b"null"):
+            c.sendto(junk, ("127.0.0.1", port))
+        c.sendto(json.dumps({"op": "ping", "t0": 1.0}).encode(), ("127.0.0.1", port))
+        reply = json.loads(c.recvfrom(4096)[0])
+    assert reply["op"] == "pong" and reply["t0"] == 1.0
+    assert reply["t1"] <= reply["t2"]
+
+
+def test_idle_follower_takes_configured_durations_not_engine_zeros(pair):
+    leader, follower = pair
+    assert wait_for(lambda: leader.followers and follower.delay is not None)
+    eng = TimerEngine(leader.clock)                     # never started: engine totals are 0
+    leader.publish({"status": "ready", "totals": [0, 0], "snap": eng.snapshot(), "at": leader.clock()})
+    assert follower.got.wait(2)
+    assert sync_durations(follower.states[-1]) is None  # nothing to copy: keep the follower's own times
+
+    # After START + RESET the engine keeps the old totals; the zones' edited durations win
+    follower.got.clear()
+    eng.start(600, 120); eng.reset()
+    leader.publish({"status": "ready", "totals": [1500, 90], "snap": eng.snapshot(), "at": leader.clock()})
+    assert follower.got.wait(2)
+    assert sync_durations(follower.states[-1]) == (1500, 90)
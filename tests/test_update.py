@@ -0,0 +1,81 @@
+"""_latest_release_tag() against a stub release API on 127.0.0.1: cache, ETag, rate limits, backoff."""
+import http.server, json, threading
+
+import pytest
+
+from podcast_timer import UPDATE_BACKOFF, UPDATE_TTL_SEC, _latest_release_tag, _read_update_cache
+
+NOW = 1_700_000_000
+
+
+class Stub(http.server.BaseHTTPRequestHandler):
+    """Answers each GET with the next queued (code, headers, body); records the request headers."""
+    def do_GET(self):
+        srv = self.server; srv.requests.append(dict(self.headers))
+        code, headers, body = srv.replies.pop(0) if srv.replies else (500, {}, None)
+        data = json.dumps(body).encode() if body is not None else b""
+        self.send_response(code)
+        for k, v in headers.items(): self.send_header(k, v)
+        self.send_header("Content-Length", str(len(data))); self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args): pass
+
+
+@pytest.fixture
+def api(tmp_path):
+    srv = http.server.HTTPServer(("127.0.0.1", 0), Stub)
+    srv.requests = []; srv.replies = []
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    srv.url = f"http://127.0.0.1:{srv.server_address[1]}/releases/latest"
+    srv.cache = str(tmp_path / "update_cache.json")
+    srv.check = lambda now: _latest_release_tag(api=srv.url, cache_file=srv.cache, now=now)
+    yield srv
+    srv.shutdown(); srv.server_close()
+
+
+def test_fresh_cache_makes_no_request(api):
+    api.replies.append((200, {"ETag": '"v1"'}, {"tag_name": "v1.3.0"}))
+    assert api.check(NOW) == "1.3.0"
+    assert api.check(NOW + UPDATE_TTL_SEC - 1) == "1.3.0"
+    assert len(api.requests) == 1
+
+
+def test_not_modified_keeps_cached_tag(api):
+    api.replies += [(200, {"ETag": '"v1"'}, {"tag_name": "v1.3.0"}), (304, {"ETag": '"v1"'}, None)]
+    api.check(NOW)
+    assert api.check(NOW + UPDATE_TTL_SEC) == "1.3.0"
+    assert api.requests[1]["If-None-Match"] == '"v1"'
+    assert _read_update_cache(api.cache)["checked"] == NOW + UPDATE_TTL_SEC
+
+
+def test_retry_after_is_honoured(api):
+    api.replies += [(200, {"ETag": '"v1"'}, {"tag_name": "v1.3.0"}), (429, {"Retry-After": "120"}, None)]
+    api.check(NOW)
+    t = NOW + UPDATE_TTL_SEC
+    assert api.check(t) == "1.3.0"
+    assert _read_update_cache(api.cache)["retry_after"] == t + 120
+    assert api.check(t + 119) == "1.3.0" and len(api.requests) == 2
+
+
+def test_rate_limit_reset_is_honoured(api):
+    reset = {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(NOW + 3000)}
+    api.replies += [(200, dict(reset, ETag='"v1"'), {"tag_name": "v1.3.0"}), (304, {}, None)]
+    assert api.check(NOW) == "1.3.0"
+    assert _read_update_cache(api.cache)["retry_after"] == NOW + 3000
+    api.check(NOW + 2999); assert len(api.requests) == 1
+    api.check(NOW + UPDATE_TTL_SEC); assert len(api.requests) == 2
+
+
+def test_failures_back_off_exponentially_up_to_a_day(api):
+    base, cap = UPDATE_BACKOFF
+    t = NOW; waits = []
+    for _ in range(9):
+        api.replies.append((500, {}, None))
+        assert api.check(t) is None
+        wait = _read_update_cache(api.cache)["retry_after"] - t
+        assert api.check(t + wait - 1) is None         # still backing off: no request
+        waits.append(wait); t += wait
+    assert len(api.requests) == 9
+    assert waits == [min(cap, base * 2 ** i) for i in range(9)]
+    assert waits[-1] == cap == 86400
@@ -0,0 +1,62 @@
+"""VoiceActivity attack/hangover transitions on synthetic WAV files (read without real-time pacing)."""
+import wave
+
+import numpy as np
+
+from podcast_timer import VAD_ATTACK_MS, VAD_FRAME_MS, VAD_HANG_MS, VoiceActivity
+
+RATE = 16000
+
+
+class NoPacing:
+    """Stands in for VoiceActivity._stop so _wav_blocks doesn't wait out real time."""
+    def is_set(self): return False
+    def wait(self, timeout=None): return False
+
+
+def write_wav(path, segments, width=2, channels=1):
+    """segments: (seconds, amplitude) pairs; amplitude 0 is near-silent noise, otherwise a 440 Hz tone."""
+    rng = np.random.default_rng(1); parts = []
+    for sec, amp in segments:
+        t = np.arange(int(sec * RATE)) / RATE
+        parts.append(amp * np.sin(2 * np.pi * 440 * t) if amp else rng.normal(0, 1e-3, len(t)))
+    x = np.concatenate(parts)
+    if width == 1: pcm = (x * 127 + 128).astype(np.uint8)
+    else: pcm = (x * 32767).astype(np.int16)
+    pcm = np.repeat(pcm, channels)
+    with wave.open(str(path), "wb") as wf:
+        wf.setnchannels(channels); wf.setsampwidth(width); wf.setframerate(RATE)
+        wf.writeframes(pcm.tobytes())
+
+
+def transitions(path):
+    """(active, seconds into the file) for each on_change call."""
+    events = []; pos = [0]
+    vad = VoiceActivity(lambda active: events.append((active, pos[0] / RATE)), str(path), block_ms=VAD_FRAME_MS)
+    vad._stop = NoPacing()
+    blocks, rate = vad._wav_blocks(np)
+    def counted():
+        for b in blocks: pos[0] += len(b); yield b
+    vad._analyse(np, counted(), rate)
+    return events
+
+
+def test_attack_and_hangover(tmp_path):
+    p = tmp_path / "talk.wav"
+    write_wav(p, [(1.0, 0), (0.06, 0.3),             # a click shorter than the attack: ignored
+                  (0.5, 0), (1.0, 0.3),              # talking starts at 1.56 s
+                  (0.5, 0), (0.5, 0.3),              # a pause shorter than the hangover: still talking
+                  (1.5, 0)])                         # stopped at 3.56 s
+    ev = transitions(p)
+    assert [a for a, _ in ev] == [True, False]
+    on, off = ev[0][1], ev[1][1]
+    assert abs(on - (1.56 + VAD_ATTACK_MS / 1000)) <= 0.03
+    assert abs(off - (3.56 + VAD_HANG_MS / 1000)) <= 0.03
+
+
+def test_end_of_input_counts_as_silence(tmp_path):
+    p = tmp_path / "stereo8.wav"
+    write_wav(p, [(0.5, 0), (1.0, 0.5)], width=1, channels=2)
+    ev = transitions(p)
+    assert [a for a, _ in ev] == [True, False]
+    assert ev[1][1] == 1.5